@@ -9,6 +9,7 @@ API Documentation: https://docs.sleeper.com/
 
 import asyncio
 import time
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 import httpx
@@ -412,7 +413,8 @@ class LeagueContext:
     Helper class to hold league context and provide convenient lookups.
 
     Caches league data and provides methods to resolve roster IDs to team names,
-    player IDs to player info, etc.
+    player IDs to player info, etc. Season-wide fetches made through the context
+    are memoized so services sharing it only hit the API once.
     """
 
     def __init__(
@@ -421,11 +423,15 @@ class LeagueContext:
         users: list[User],
         rosters: list[Roster],
         players: dict[str, Player],
+        client: SleeperClient | None = None,
     ):
         self.league = league
         self.users = users
         self.rosters = rosters
         self.players = players
+        self.client = client
+
+        self._fetch_cache: dict[tuple, asyncio.Future] = {}
 
         self._user_map: dict[str, User] = {u.user_id: u for u in users}
         self._roster_map: dict[int, Roster] = {r.roster_id: r for r in rosters}
@@ -457,7 +463,90 @@ class LeagueContext:
         if league is None:
             raise SleeperAPIError(f"League not found: {league_id}")
 
-        return cls(league=league, users=users, rosters=rosters, players=players)
+        return cls(
+            league=league, users=users, rosters=rosters, players=players, client=client
+        )
+
+    def _require_client(self) -> SleeperClient:
+        """Get the client this context fetches through, raising if not set."""
+        if self.client is None:
+            raise RuntimeError(
+                "LeagueContext has no SleeperClient; create it with LeagueContext.create()"
+            )
+        return self.client
+
+    async def _fetch_once(self, key: tuple, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run a fetch at most once per context, sharing the result between callers.
+
+        Concurrent callers with the same key await a single in-flight fetch.
+        Results are shared and must not be mutated by callers. A fetch that fails
+        or is cancelled is dropped from the cache so the next caller retries it,
+        and cancelling one caller does not cancel the fetch for the others.
+        """
+        future = self._fetch_cache.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fetch())
+            self._fetch_cache[key] = future
+
+            def _evict_failed(done: asyncio.Future) -> None:
+                if (done.cancelled() or done.exception() is not None) and (
+                    self._fetch_cache.get(key) is done
+                ):
+                    del self._fetch_cache[key]
+
+            future.add_done_callback(_evict_failed)
+        return await asyncio.shield(future)
+
+    async def get_matchups(self, week: int) -> list[dict]:
+        """
+        Get matchups for a specific week, fetching each week only once.
+
+        Args:
+            week: Week number
+
+        Returns:
+            List of raw matchup dictionaries
+        """
+        return await self._fetch_once(
+            ("matchups", week),
+            lambda: self._require_client().get_matchups(self.league_id, week),
+        )
+
+    async def get_matchups_range(
+        self, start_week: int = 1, end_week: int = 17
+    ) -> dict[int, list[dict]]:
+        """
+        Get matchups for a range of weeks, fetching each range only once.
+
+        Args:
+            start_week: Starting week
+            end_week: Ending week
+
+        Returns:
+            Dict mapping week number to matchups
+        """
+        return await self._fetch_once(
+            ("matchups_range", start_week, end_week),
+            lambda: self._require_client().get_matchups_range(
+                self.league_id, start_week, end_week
+            ),
+        )
+
+    async def get_all_transactions(self, weeks: int = 18) -> list[Transaction]:
+        """
+        Get all transactions for the season, fetching each range only once.
+
+        Args:
+            weeks: Number of weeks to fetch
+
+        Returns:
+            List of all Transaction objects
+        """
+        return await self._fetch_once(
+            ("all_transactions", weeks),
+            lambda: self._require_client().get_all_transactions(self.league_id, weeks),
+        )
 
     @property
     def league_id(self) -> str:
@@ -5,7 +5,9 @@ Identifies players who scored high points while sitting on the bench.
 """
 
 import asyncio
-from typing import Any
+import heapq
+import itertools
+from operator import attrgetter
 
 from sleeper_analytics.clients.sleeper import LeagueContext, SleeperClient
 from sleeper_analytics.models.benchwarmer import (
@@ -32,6 +34,9 @@ class BenchwarmerService:
         "DEF": ["DEF"],
     }
 
+    # Number of bench performances kept per team
+    TOP_BENCHWARMERS = 10
+
     def __init__(self, client: SleeperClient, context: LeagueContext):
         self.client = client
         self.ctx = context
@@ -61,12 +66,34 @@ class BenchwarmerService:
         Returns:
             BenchwarmerReport with top bench performances
         """
-        # Fetch matchups for all weeks concurrently
-        matchups_by_week = await self.client.get_matchups_range(
-            self.ctx.league_id, 1, weeks
-        )
+        team_name = self.ctx.get_team_name(roster_id)
+
+        # Positions that can fill at least one starting slot in this league.
+        # If none can, no benching decision could have been a mistake.
+        startable_positions = {
+            pos for pos in self.POSITION_ELIGIBILITY if self._can_player_start(pos)
+        }
+        if not startable_positions:
+            return BenchwarmerReport(
+                roster_id=roster_id,
+                team_name=team_name,
+                total_bench_points=0.0,
+                total_weeks_analyzed=weeks,
+                top_benchwarmers=[],
+                worst_benching_decision=None,
+                avg_bench_points_per_week=0.0,
+            )
 
-        all_benchwarmers: list[BenchwarmerWeek] = []
+        # Fetch matchups for all weeks concurrently
+        matchups_by_week = await self.ctx.get_matchups_range(1, weeks)
+
+        # Bounded min-heap of the top benching mistakes as raw
+        # (differential, -seq, week, player_id, position) tuples; models are only
+        # built for the entries that survive. The unique negated sequence number
+        # keeps earlier mistakes ahead of later ones with the same differential
+        # and stops tuple comparisons from ever reaching the payload fields.
+        top_heap: list[tuple[float, int, int, str, str]] = []
+        tiebreak = itertools.count()
         total_opportunity_cost = 0.0  # Total points left on bench
 
         for week, matchups in matchups_by_week.items():
@@ -93,15 +120,18 @@ class BenchwarmerService:
                 if not player_id:
                     continue
 
+                position = self.ctx.get_player_position(player_id)
+                if position not in startable_positions:
+                    continue
+
                 bench_points = float(players_points.get(player_id) or 0)
                 if bench_points <= 0:
                     continue
 
-                position = self.ctx.get_player_position(player_id)
                 eligible_slots = self.POSITION_ELIGIBILITY.get(position, [])
 
                 # Find the worst-performing starter in an eligible slot
-                worst_starter_points = float('inf')
+                worst_starter_points: float | None = None
                 for idx, starter_id in enumerate(starters):
                     if idx >= len(roster_positions):
                         break
@@ -109,42 +139,45 @@ class BenchwarmerService:
                     slot = roster_positions[idx]
                     if slot in eligible_slots and starter_id:
                         starter_points = float(players_points.get(starter_id) or 0)
-                        worst_starter_points = min(worst_starter_points, starter_points)
+                        if worst_starter_points is None or starter_points < worst_starter_points:
+                            worst_starter_points = starter_points
 
                 # Calculate differential (opportunity cost)
-                if worst_starter_points != float('inf'):
+                if worst_starter_points is not None:
                     differential = bench_points - worst_starter_points
 
                     # Only count if benching was a mistake (positive differential)
                     if differential > 0:
                         total_opportunity_cost += differential
 
-                        all_benchwarmers.append(
-                            BenchwarmerWeek(
-                                week=week,
-                                player_id=player_id,
-                                player_name=self.ctx.get_player_name(player_id),
-                                position=position,
-                                points=differential,  # Store differential, not raw points
-                                roster_id=roster_id,
-                                team_name=self.ctx.get_team_name(roster_id),
-                                was_benched=True,
-                                could_have_started=True,
-                            )
-                        )
-
-        # Sort by differential to get worst decisions
-        all_benchwarmers.sort(key=lambda x: x.points, reverse=True)
-
-        # Top 10 bench performances
-        top_benchwarmers = all_benchwarmers[:10]
+                        entry = (differential, -next(tiebreak), week, player_id, position)
+                        if len(top_heap) < self.TOP_BENCHWARMERS:
+                            heapq.heappush(top_heap, entry)
+                        elif differential > top_heap[0][0]:
+                            heapq.heapreplace(top_heap, entry)
+
+        # Top 10 bench performances, highest differential first
+        top_benchwarmers = [
+            BenchwarmerWeek(
+                week=week,
+                player_id=player_id,
+                player_name=self.ctx.get_player_name(player_id),
+                position=position,
+                points=differential,  # Store differential, not raw points
+                roster_id=roster_id,
+                team_name=team_name,
+                was_benched=True,
+                could_have_started=True,
+            )
+            for differential, _, week, player_id, position in sorted(top_heap, reverse=True)
+        ]
 
         # Worst benching decision = highest differential
-        worst_decision = all_benchwarmers[0] if all_benchwarmers else None
+        worst_decision = top_benchwarmers[0] if top_benchwarmers else None
 
         return BenchwarmerReport(
             roster_id=roster_id,
-            team_name=self.ctx.get_team_name(roster_id),
+            team_name=team_name,
             total_bench_points=round(total_opportunity_cost, 2),
             total_weeks_analyzed=weeks,
             top_benchwarmers=top_benchwarmers,
@@ -172,16 +205,15 @@ class BenchwarmerService:
         all_team_reports = await asyncio.gather(*tasks)
 
         # Find benchwarmer champion (most points on bench)
-        benchwarmer_champ = max(all_team_reports, key=lambda x: x.total_bench_points)
+        benchwarmer_champ = max(all_team_reports, key=attrgetter("total_bench_points"))
 
         # Collect all benchwarmers across league
         all_benchwarmers: list[BenchwarmerWeek] = []
         for report in all_team_reports:
             all_benchwarmers.extend(report.top_benchwarmers)
 
-        # Sort to get biggest mistakes
-        all_benchwarmers.sort(key=lambda x: x.points, reverse=True)
-        biggest_mistakes = all_benchwarmers[:20]  # Top 20 league-wide
+        # Biggest mistakes, top 20 league-wide
+        biggest_mistakes = heapq.nlargest(20, all_benchwarmers, key=attrgetter("points"))
 
         return LeagueBenchwarmerReport(
             league_id=self.ctx.league_id,
@@ -5,6 +5,9 @@ Analyzes draft performance and identifies best/worst picks.
 """
 
 from collections import defaultdict
+from operator import attrgetter
+
+import numpy as np
 
 from sleeper_analytics.clients.sleeper import LeagueContext, SleeperClient
 from sleeper_analytics.models.draft import (
@@ -26,45 +29,36 @@ class DraftAnalysisService:
         self.client = client
         self.ctx = context
 
-    async def _get_player_points_by_week(
-        self, player_id: str, weeks: int = 17
-    ) -> dict[int, float]:
-        """Get points scored by a player each week."""
-        matchups_by_week = await self.client.get_matchups_range(
-            self.ctx.league_id, 1, weeks
-        )
+    async def _get_player_points_by_week(self, weeks: int = 17) -> dict[str, np.ndarray]:
+        """
+        Get points scored by every player each week.
 
-        points_by_week: dict[int, float] = {}
+        Fetches the season's matchups once and lays each player's scores out as a
+        dense array indexed by ``week - 1`` (zero for weeks without a score).
+        """
+        matchups_by_week = await self.ctx.get_matchups_range(1, weeks)
+
+        points_by_player: dict[str, np.ndarray] = defaultdict(
+            lambda: np.zeros(weeks, dtype=np.float64)
+        )
 
         for week, matchups in matchups_by_week.items():
             for matchup in matchups:
-                players_points = matchup.get("players_points", {})
-                if player_id in players_points:
-                    points_by_week[week] = float(players_points[player_id])
-                    break
+                players_points = matchup.get("players_points") or {}
+                for player_id, points in players_points.items():
+                    points_by_player[player_id][week - 1] = float(points or 0)
 
-        return points_by_week
+        return dict(points_by_player)
 
-    def _calculate_value_rating(
-        self, points: float, round_num: int, avg_round_points: float
-    ) -> str:
-        """Classify pick as Hit/Solid/Bust."""
+    def _value_rating_thresholds(
+        self, round_num: int, avg_round_points: float
+    ) -> tuple[float, float]:
+        """Get the (Hit, Solid) point thresholds for picks in a round."""
         # Early rounds (1-4) held to higher standard
         if round_num <= 4:
-            if points >= avg_round_points * 1.5:
-                return "Hit"
-            elif points >= avg_round_points * 0.7:
-                return "Solid"
-            else:
-                return "Bust"
+            return avg_round_points * 1.5, avg_round_points * 0.7
         # Later rounds (5+)
-        else:
-            if points >= avg_round_points * 1.3:
-                return "Hit"
-            elif points >= avg_round_points * 0.5:
-                return "Solid"
-            else:
-                return "Bust"
+        return avg_round_points * 1.3, avg_round_points * 0.5
 
     def _calculate_draft_grade(self, avg_points_per_pick: float, league_avg: float) -> str:
         """Calculate letter grade based on performance vs league average."""
@@ -116,6 +110,9 @@ class DraftAnalysisService:
         if not draft_picks_raw:
             raise ValueError(f"No draft picks found for draft {draft_id}")
 
+        # Weekly points for every player, fetched once for all picks
+        points_by_player = await self._get_player_points_by_week(weeks)
+
         # Process each pick
         all_picks: list[DraftPick] = []
 
@@ -130,9 +127,13 @@ class DraftAnalysisService:
                 continue
 
             # Get player points
-            points_by_week = await self._get_player_points_by_week(player_id, weeks)
-            total_points = sum(points_by_week.values())
-            games_played = len([p for p in points_by_week.values() if p > 0])
+            points_by_week = points_by_player.get(player_id)
+            if points_by_week is None:
+                total_points = 0.0
+                games_played = 0
+            else:
+                total_points = sum(points_by_week.tolist())
+                games_played = int(np.count_nonzero(points_by_week > 0))
             ppg = total_points / games_played if games_played > 0 else 0
 
             # Check if still on roster
@@ -177,12 +178,19 @@ class DraftAnalysisService:
             for round_num, picks in rounds_dict.items()
         }
 
-        # Update value ratings
+        # Update value ratings (Hit/Solid/Bust) against per-round thresholds
+        round_thresholds = {
+            round_num: self._value_rating_thresholds(round_num, avg)
+            for round_num, avg in round_avgs.items()
+        }
         for pick in all_picks:
-            avg_for_round = round_avgs.get(pick.round, 0)
-            pick.value_rating = self._calculate_value_rating(
-                pick.points_scored, pick.round, avg_for_round
-            )
+            hit_threshold, solid_threshold = round_thresholds[pick.round]
+            if pick.points_scored >= hit_threshold:
+                pick.value_rating = "Hit"
+            elif pick.points_scored >= solid_threshold:
+                pick.value_rating = "Solid"
+            else:
+                pick.value_rating = "Bust"
 
         # Create round summaries
         round_summaries: list[RoundSummary] = []
@@ -251,8 +259,9 @@ class DraftAnalysisService:
                 team_grade.avg_points_per_pick, league_avg_ppick
             )
 
-        # Sort teams by avg points per pick
-        team_grades.sort(key=lambda t: t.avg_points_per_pick, reverse=True)
+        # Sort teams by avg points per pick. The ranked order is part of the
+        # report, so the best/worst drafters fall out of the ends of the sort.
+        team_grades.sort(key=attrgetter("avg_points_per_pick"), reverse=True)
 
         # Identify best/worst drafters
         best_drafter = team_grades[0]
@@ -5,12 +5,59 @@ Analyzes how well teams utilize their rosters - comparing actual lineups
 to optimal lineups and identifying missed opportunities.
 """
 
+import heapq
 from collections import defaultdict
+from collections.abc import Iterator
+from operator import itemgetter
 from typing import Any
 
 from sleeper_analytics.clients.sleeper import LeagueContext, SleeperClient
 from sleeper_analytics.models.matchup import EfficiencyReport, SeasonEfficiency
 
+# Sort keys for missed-opportunity and ranking rows
+_by_points_lost = itemgetter("points_lost")
+_by_efficiency_pct = itemgetter("efficiency_pct")
+
+
+def _optimal_points(
+    fixed_slots: dict[str, int],
+    flex_slots: tuple[tuple[str, ...], ...],
+    pos_pts: dict[str, list[float]],
+) -> float:
+    """
+    Fill each slot with the highest-scoring unused eligible player.
+
+    Single-position slots are filled first by taking the top scorers of each
+    position. Flex slots follow, most restrictive first. Each position's points
+    are sorted descending, so a per-position pointer marks its best unused
+    player and a flex slot only peeks at the heads of its eligible positions.
+    """
+    idx = dict.fromkeys(pos_pts, 0)
+    total = 0.0
+
+    for pos, count in fixed_slots.items():
+        pts = pos_pts.get(pos)
+        if pts:
+            taken = min(count, len(pts))
+            total += sum(pts[:taken])
+            idx[pos] = taken
+
+    for eligible in flex_slots:
+        best_pos = None
+        best_pts = 0.0
+        for pos in eligible:
+            pts = pos_pts.get(pos)
+            if pts and idx[pos] < len(pts):
+                head = pts[idx[pos]]
+                if best_pos is None or head > best_pts:
+                    best_pos = pos
+                    best_pts = head
+        if best_pos is not None:
+            idx[best_pos] += 1
+            total += best_pts
+
+    return total
+
 
 class EfficiencyService:
     """
@@ -37,9 +84,66 @@ class EfficiencyService:
         "REC_FLEX": ["WR", "TE"],  # QB NOT allowed
     }
 
+    # Lineup assumed when the league doesn't report its roster positions
+    DEFAULT_ROSTER_POSITIONS = ("QB", "RB", "RB", "WR", "WR", "TE", "FLEX", "K", "DEF")
+
     def __init__(self, client: SleeperClient, context: LeagueContext):
         self.client = client
         self.ctx = context
+        self._roster_positions = tuple(
+            context.league.roster_positions or self.DEFAULT_ROSTER_POSITIONS
+        )
+        # Split the lineup into per-position slot counts and flex slots, the
+        # latter as eligible player positions, most restrictive first
+        self._fixed_slots: dict[str, int] = {}
+        flex_slots = []
+        for pos in self._roster_positions:
+            if pos in ("BN", "IR"):
+                continue
+            eligible = tuple(self.SLOT_ELIGIBILITY.get(pos, [pos]))
+            if len(eligible) == 1:
+                self._fixed_slots[eligible[0]] = self._fixed_slots.get(eligible[0], 0) + 1
+            else:
+                flex_slots.append(eligible)
+        self._flex_slots = tuple(sorted(flex_slots, key=len))
+        self._player_meta: dict[str, tuple[str, str]] = {}
+        self._roster_matchups: dict[int, dict[int, dict]] = {}
+        self._weekly_reports: dict[int, dict[tuple[int, int], EfficiencyReport]] = {}
+
+    def _get_player_meta(self, player_id: str) -> tuple[str, str]:
+        """Get a player's (position, name), resolving each player only once."""
+        meta = self._player_meta.get(player_id)
+        if meta is None:
+            meta = self._player_meta[player_id] = (
+                self.ctx.get_player_position(player_id),
+                self.ctx.get_player_name(player_id),
+            )
+        return meta
+
+    def _index_week(self, week: int, matchups: list[dict]) -> dict[int, dict]:
+        """Index a week's raw matchups by roster ID, keeping the first entry per roster."""
+        by_roster = self._roster_matchups.get(week)
+        if by_roster is None:
+            by_roster = {}
+            for m in matchups:
+                by_roster.setdefault(m.get("roster_id"), m)
+            self._roster_matchups[week] = by_roster
+        return by_roster
+
+    async def _get_roster_matchup(self, roster_id: int, week: int) -> dict | None:
+        """Get a roster's raw matchup for a week, indexing each week only once."""
+        by_roster = self._roster_matchups.get(week)
+        if by_roster is None:
+            by_roster = self._index_week(week, await self.ctx.get_matchups(week))
+        return by_roster.get(roster_id)
+
+    async def _get_season_matchups(self, weeks: int) -> dict[int, dict[int, dict]]:
+        """Fetch weeks 1..weeks in one batch, indexed by week then roster ID."""
+        matchups_by_week = await self.ctx.get_matchups_range(1, weeks)
+        return {
+            week: self._index_week(week, matchups_by_week.get(week) or [])
+            for week in range(1, weeks + 1)
+        }
 
     async def analyze_weekly_efficiency(
         self, roster_id: int, week: int
@@ -56,56 +160,33 @@ class EfficiencyService:
         Returns:
             EfficiencyReport with detailed analysis
         """
-        matchups = await self.client.get_matchups(self.ctx.league_id, week)
-
         # Find this team's matchup data
-        roster_matchup = None
-        for m in matchups:
-            if m.get("roster_id") == roster_id:
-                roster_matchup = m
-                break
+        roster_matchup = await self._get_roster_matchup(roster_id, week)
+        return self._build_weekly_report(roster_id, week, roster_matchup)
 
+    def _build_weekly_report(
+        self, roster_id: int, week: int, roster_matchup: dict | None
+    ) -> EfficiencyReport:
+        """Build a team's weekly efficiency report from its raw matchup data."""
         if not roster_matchup:
-            return EfficiencyReport(
-                week=week,
-                roster_id=roster_id,
-                team_name=self.ctx.get_team_name(roster_id),
-                points_scored=0,
-                potential_points=0,
-                efficiency_pct=0,
-                bench_points=0,
-                missed_opportunities=[],
-            )
+            return self._empty_report(roster_id, week)
 
-        starters = roster_matchup.get("starters") or []
         players = roster_matchup.get("players") or []
         players_points = roster_matchup.get("players_points") or {}
         points_scored = roster_matchup.get("points") or 0
 
-        # Calculate bench points
-        bench_players = [p for p in players if p not in starters]
-        bench_points = sum(
-            float(players_points.get(p) or 0) for p in bench_players
-        )
+        # Nothing to optimize without per-player scoring
+        if not players or not players_points:
+            return self._empty_report(roster_id, week, points_scored)
 
-        # Group players by position
-        positions: dict[str, list[dict[str, Any]]] = defaultdict(list)
-        for player_id in players:
-            if player_id:
-                pos = self.ctx.get_player_position(player_id)
-                pts = float(players_points.get(player_id) or 0)
-                positions[pos].append({
-                    "player_id": player_id,
-                    "name": self.ctx.get_player_name(player_id),
-                    "points": pts,
-                })
+        starters = frozenset(roster_matchup.get("starters") or [])
 
-        # Sort each position by points
-        for pos in positions:
-            positions[pos].sort(key=lambda x: x["points"], reverse=True)
+        pos_ids, pos_pts, bench_points = self._group_by_position(
+            players, players_points, starters
+        )
 
         # Calculate optimal lineup
-        potential_points = self._calculate_optimal_lineup(positions)
+        potential_points = self._calculate_optimal_lineup(pos_pts)
 
         # Calculate efficiency
         efficiency_pct = (
@@ -114,7 +195,7 @@ class EfficiencyService:
 
         # Find missed opportunities
         missed_opportunities = self._find_missed_opportunities(
-            positions, starters
+            pos_ids, pos_pts, starters
         )
 
         return EfficiencyReport(
@@ -128,83 +209,143 @@ class EfficiencyService:
             missed_opportunities=missed_opportunities,
         )
 
-    def _calculate_optimal_lineup(
-        self, positions: dict[str, list[dict[str, Any]]]
-    ) -> float:
-        """Calculate optimal lineup points based on league roster positions."""
-        roster_positions = self.ctx.league.roster_positions
-        if not roster_positions:
-            roster_positions = ["QB", "RB", "RB", "WR", "WR", "TE", "FLEX", "K", "DEF"]
-
-        optimal_points = 0.0
-        used_players: set[str] = set()
+    def _group_by_position(
+        self, players: list[str], players_points: dict[str, Any], starters: frozenset[str]
+    ) -> tuple[dict[str, list[str]], dict[str, list[float]], float]:
+        """
+        Group a team-week's players by position.
 
-        for pos in roster_positions:
-            if pos in ("BN", "IR"):
-                continue
+        Returns:
+            Tuple of (player IDs by position, points by position, bench points),
+            with each position's parallel lists sorted by points descending
+        """
+        # Coerce each player's points to float once
+        pp = {k: float(v or 0) for k, v in players_points.items()}
+
+        # Group player IDs and points by position as parallel lists,
+        # totalling bench points in the same pass
+        pos_ids: dict[str, list[str]] = defaultdict(list)
+        pos_pts: dict[str, list[float]] = defaultdict(list)
+        bench_points = 0.0
+        player_meta = self._player_meta
+        for player_id in players:
+            if player_id:
+                pts = pp.get(player_id, 0.0)
+                if player_id not in starters:
+                    bench_points += pts
+                meta = player_meta.get(player_id) or self._get_player_meta(player_id)
+                pos = meta[0]
+                pos_ids[pos].append(player_id)
+                pos_pts[pos].append(pts)
 
-            if pos in ("FLEX", "SUPER_FLEX", "REC_FLEX"):
-                # Get eligible positions for this slot
-                eligible_positions = self.SLOT_ELIGIBILITY.get(pos, [])
+        # Sort each position by points
+        for pos, pts in pos_pts.items():
+            order = sorted(range(len(pts)), key=pts.__getitem__, reverse=True)
+            ids = pos_ids[pos]
+            pos_ids[pos] = [ids[i] for i in order]
+            pos_pts[pos] = [pts[i] for i in order]
 
-                # Find all eligible candidates
-                candidates = []
-                for eligible_pos in eligible_positions:
-                    for p in positions.get(eligible_pos, []):
-                        if p["player_id"] not in used_players:
-                            candidates.append(p)
+        return pos_ids, pos_pts, bench_points
 
-                # Sort by points and take the best
-                candidates.sort(key=lambda x: x["points"], reverse=True)
-                if candidates:
-                    optimal_points += candidates[0]["points"]
-                    used_players.add(candidates[0]["player_id"])
+    def _empty_report(
+        self, roster_id: int, week: int, points_scored: float = 0
+    ) -> EfficiencyReport:
+        """Build a report for a week with no per-player scoring to analyze."""
+        return EfficiencyReport(
+            week=week,
+            roster_id=roster_id,
+            team_name=self.ctx.get_team_name(roster_id),
+            points_scored=round(points_scored, 2),
+            potential_points=0,
+            efficiency_pct=0,
+            bench_points=0,
+            missed_opportunities=[],
+        )
 
-            else:
-                # Standard position
-                pos_players = positions.get(pos, [])
-                for p in pos_players:
-                    if p["player_id"] not in used_players:
-                        optimal_points += p["points"]
-                        used_players.add(p["player_id"])
-                        break
+    def _calculate_optimal_lineup(self, pos_pts: dict[str, list[float]]) -> float:
+        """
+        Calculate optimal lineup points based on league roster positions.
 
-        return optimal_points
+        Slot eligibility is nested (e.g. WR within REC_FLEX within FLEX within
+        SUPER_FLEX), so filling the most restrictive slots first with the best
+        remaining eligible player gives the true maximum, whatever order the
+        league lists its slots in.
+        """
+        return _optimal_points(self._fixed_slots, self._flex_slots, pos_pts)
 
     def _find_missed_opportunities(
         self,
-        positions: dict[str, list[dict[str, Any]]],
-        starters: list[str],
+        pos_ids: dict[str, list[str]],
+        pos_pts: dict[str, list[float]],
+        starters: frozenset[str],
     ) -> list[dict[str, Any]]:
         """Find players who should have been started over actual starters."""
         missed = []
 
-        for pos, players_list in positions.items():
-            if len(players_list) > 1:
-                # Check if the highest scorer was benched
-                best = players_list[0]
-                if best["player_id"] not in starters:
-                    # Find who was started at this position
-                    started_player = next(
-                        (p for p in players_list if p["player_id"] in starters),
-                        None,
-                    )
-                    if started_player and started_player["points"] < best["points"]:
-                        missed.append({
-                            "position": pos,
-                            "benched_player": best["name"],
-                            "benched_points": round(best["points"], 2),
-                            "started_player": started_player["name"],
-                            "started_points": round(started_player["points"], 2),
-                            "points_lost": round(
-                                best["points"] - started_player["points"], 2
-                            ),
-                        })
+        for pos, started in self._missed_positions(pos_ids, pos_pts, starters):
+            ids = pos_ids[pos]
+            pts = pos_pts[pos]
+            missed.append({
+                "position": pos,
+                "benched_player": self._get_player_meta(ids[0])[1],
+                "benched_points": round(pts[0], 2),
+                "started_player": self._get_player_meta(ids[started])[1],
+                "started_points": round(pts[started], 2),
+                "points_lost": round(pts[0] - pts[started], 2),
+            })
 
         # Sort by points lost
-        missed.sort(key=lambda x: x["points_lost"], reverse=True)
+        missed.sort(key=_by_points_lost, reverse=True)
         return missed
 
+    def _missed_positions(
+        self,
+        pos_ids: dict[str, list[str]],
+        pos_pts: dict[str, list[float]],
+        starters: frozenset[str],
+    ) -> Iterator[tuple[str, int]]:
+        """Yield (position, index of best starter) where a higher scorer was benched."""
+        for pos, ids in pos_ids.items():
+            if len(ids) > 1:
+                # Indexes of this position's starters, best first
+                started_here = [i for i, player_id in enumerate(ids) if player_id in starters]
+
+                # Skip if nobody started here or the highest scorer was started
+                if not started_here or started_here[0] == 0:
+                    continue
+
+                started = started_here[0]
+                pts = pos_pts[pos]
+                if pts[started] < pts[0]:
+                    yield pos, started
+
+    def _weekly_totals(self, roster_matchup: dict | None) -> tuple[float, float, int]:
+        """
+        Summarize a team-week without building its full report.
+
+        Returns:
+            Tuple of (points scored, potential points, missed opportunity count),
+            rounded as in the matching EfficiencyReport
+        """
+        if not roster_matchup:
+            return 0.0, 0.0, 0
+
+        players = roster_matchup.get("players") or []
+        players_points = roster_matchup.get("players_points") or {}
+        points_scored = roster_matchup.get("points") or 0
+
+        if not players or not players_points:
+            return round(points_scored, 2), 0.0, 0
+
+        starters = frozenset(roster_matchup.get("starters") or [])
+        pos_ids, pos_pts, _ = self._group_by_position(players, players_points, starters)
+
+        return (
+            round(points_scored, 2),
+            round(self._calculate_optimal_lineup(pos_pts), 2),
+            sum(1 for _ in self._missed_positions(pos_ids, pos_pts, starters)),
+        )
+
     async def get_season_efficiency(
         self, roster_id: int, weeks: int = 17
     ) -> SeasonEfficiency:
@@ -218,13 +359,24 @@ class EfficiencyService:
         Returns:
             SeasonEfficiency with aggregated metrics
         """
+        season = await self._get_season_matchups(weeks)
+        all_weeks = [
+            self._build_weekly_report(roster_id, week, season[week].get(roster_id))
+            for week in range(1, weeks + 1)
+        ]
+
+        return self._summarize_season(roster_id, all_weeks)
+
+    def _summarize_season(
+        self, roster_id: int, all_weeks: list[EfficiencyReport]
+    ) -> SeasonEfficiency:
+        """Aggregate a team's weekly efficiency reports into season metrics."""
         weekly_efficiency: list[EfficiencyReport] = []
         total_scored = 0.0
         total_potential = 0.0
         total_missed = 0
 
-        for week in range(1, weeks + 1):
-            eff = await self.analyze_weekly_efficiency(roster_id, week)
+        for eff in all_weeks:
             if eff.points_scored > 0:  # Only include weeks with data
                 weekly_efficiency.append(eff)
                 total_scored += eff.points_scored
@@ -246,6 +398,31 @@ class EfficiencyService:
             total_missed_opportunities=total_missed,
         )
 
+    async def _compute_all_weekly(
+        self, weeks: int
+    ) -> dict[tuple[int, int], EfficiencyReport]:
+        """
+        Analyze every team-week once for the league-wide missed-start report.
+
+        Returns:
+            Dict mapping (roster_id, week) to EfficiencyReport, ordered by
+            roster then week
+        """
+        reports = self._weekly_reports.get(weeks)
+        if reports is None:
+            season = await self._get_season_matchups(weeks)
+            reports = self._weekly_reports.setdefault(
+                weeks,
+                {
+                    (roster.roster_id, week): self._build_weekly_report(
+                        roster.roster_id, week, season[week].get(roster.roster_id)
+                    )
+                    for roster in self.ctx.rosters
+                    for week in range(1, weeks + 1)
+                },
+            )
+        return reports
+
     async def get_league_efficiency_rankings(
         self, weeks: int = 17
     ) -> list[dict[str, Any]]:
@@ -258,23 +435,42 @@ class EfficiencyService:
         Returns:
             List of teams ranked by efficiency percentage
         """
+        season = await self._get_season_matchups(weeks)
+
         rankings = []
 
         for roster in self.ctx.rosters:
-            eff = await self.get_season_efficiency(roster.roster_id, weeks)
+            total_scored = 0.0
+            total_potential = 0.0
+            total_missed = 0
+
+            # Only the season totals are ranked, so skip the per-week reports
+            for week in range(1, weeks + 1):
+                scored, potential, missed = self._weekly_totals(
+                    season[week].get(roster.roster_id)
+                )
+                if scored > 0:  # Only include weeks with data
+                    total_scored += scored
+                    total_potential += potential
+                    total_missed += missed
+
+            efficiency_pct = (
+                (total_scored / total_potential * 100) if total_potential > 0 else 0
+            )
+
             rankings.append({
                 "rank": 0,  # Will be set after sorting
-                "roster_id": eff.roster_id,
-                "team_name": eff.team_name,
-                "efficiency_pct": eff.season_efficiency_pct,
-                "points_scored": eff.total_points_scored,
-                "potential_points": eff.total_potential_points,
-                "points_left_on_bench": eff.points_left_on_bench,
-                "missed_opportunities": eff.total_missed_opportunities,
+                "roster_id": roster.roster_id,
+                "team_name": self.ctx.get_team_name(roster.roster_id),
+                "efficiency_pct": round(efficiency_pct, 1),
+                "points_scored": round(total_scored, 2),
+                "potential_points": round(total_potential, 2),
+                "points_left_on_bench": round(total_potential - total_scored, 2),
+                "missed_opportunities": total_missed,
             })
 
         # Sort by efficiency percentage descending
-        rankings.sort(key=lambda x: x["efficiency_pct"], reverse=True)
+        rankings.sort(key=_by_efficiency_pct, reverse=True)
 
         # Set ranks
         for i, team in enumerate(rankings):
@@ -295,19 +491,17 @@ class EfficiencyService:
         Returns:
             List of the biggest missed opportunities
         """
-        all_missed = []
+        weekly_reports = await self._compute_all_weekly(weeks)
 
-        for roster in self.ctx.rosters:
-            for week in range(1, weeks + 1):
-                eff = await self.analyze_weekly_efficiency(roster.roster_id, week)
-                for opp in eff.missed_opportunities:
-                    all_missed.append({
-                        "week": week,
-                        "team": eff.team_name,
-                        **opp,
-                    })
+        all_missed = []
 
-        # Sort by points lost
-        all_missed.sort(key=lambda x: x["points_lost"], reverse=True)
+        for eff in weekly_reports.values():
+            for opp in eff.missed_opportunities:
+                all_missed.append({
+                    "week": eff.week,
+                    "team": eff.team_name,
+                    **opp,
+                })
 
-        return all_missed[:top_n]
+        # Top N by points lost
+        return heapq.nlargest(top_n, all_missed, key=_by_points_lost)
@@ -5,10 +5,17 @@ Tracks player lifecycle and FAAB spending efficiency.
 """
 
 import asyncio
-from collections import defaultdict
-from typing import Any
+import heapq
+import re
+from collections import Counter, defaultdict
+from itertools import chain
+from operator import attrgetter
+from typing import Any, NamedTuple
+
+import numpy as np
 
 from sleeper_analytics.clients.sleeper import LeagueContext, SleeperClient
+from sleeper_analytics.models import Transaction
 from sleeper_analytics.models.faab import (
     LeagueFAABReport,
     OwnerFAABPerformance,
@@ -16,6 +23,45 @@ from sleeper_analytics.models.faab import (
     PlayerOwnershipPeriod,
 )
 
+# Waiver notes marking a claim that didn't go through
+_FAILED_CLAIM_RE = re.compile(r"claimed by another|failed|too many", re.IGNORECASE)
+
+
+class _Period(NamedTuple):
+    """A raw ownership period, before points and ROI are attached."""
+
+    owner_roster_id: int
+    start_week: int
+    end_week: int
+    faab_spent: int
+
+
+def _finite_roi_summary(
+    periods: list[PlayerOwnershipPeriod],
+) -> tuple[PlayerOwnershipPeriod | None, PlayerOwnershipPeriod | None, float, int]:
+    """
+    Summarize the periods with a finite ROI (below the 999.99 sentinel) in one pass.
+
+    Returns:
+        Tuple of (best ROI period, worst ROI period, ROI total, count), where
+        ties keep the earliest period
+    """
+    best: PlayerOwnershipPeriod | None = None
+    worst: PlayerOwnershipPeriod | None = None
+    rois: list[float] = []
+
+    for p in periods:
+        if p.roi >= 999:
+            continue
+        rois.append(p.roi)
+        if best is None or p.roi > best.roi:
+            best = p
+        if worst is None or p.roi < worst.roi:
+            worst = p
+
+    # sum() rather than a running += so the total rounds exactly as it always has
+    return best, worst, sum(rois), len(rois)
+
 
 class FAABService:
     """
@@ -27,128 +73,187 @@ class FAABService:
     def __init__(self, client: SleeperClient, context: LeagueContext):
         self.client = client
         self.ctx = context
+        self._points_index: dict[int, dict[str, dict[int, float]]] = {}
+        self._txn_index: dict[int, dict[str, list[Transaction]]] = {}
+        # Team names resolved once, for the per-period owner lookups
+        self._team_names = {
+            r.roster_id: context.get_team_name(r.roster_id) for r in context.rosters
+        }
+
+    async def _build_points_index(self, weeks: int = 17) -> dict[str, dict[int, float]]:
+        """
+        Index points scored by every player each week, built once per season length.
+
+        Returns:
+            Dict mapping player ID to {week: points}
+        """
+        index = self._points_index.get(weeks)
+        if index is None:
+            matchups_by_week = await self.ctx.get_matchups_range(1, weeks)
+
+            built: dict[str, dict[int, float]] = defaultdict(dict)
+            for week, matchups in matchups_by_week.items():
+                for matchup in matchups:
+                    for player_id, pts in matchup.get("players_points", {}).items():
+                        # Keep the first matchup listing the player that week
+                        built[player_id].setdefault(week, float(pts or 0))
+
+            index = self._points_index.setdefault(weeks, dict(built))
+        return index
 
     async def _get_player_points_by_week(
         self, player_id: str, weeks: int = 17
     ) -> dict[int, float]:
         """Get points scored by a player each week."""
-        matchups_by_week = await self.client.get_matchups_range(
-            self.ctx.league_id, 1, weeks
-        )
+        index = await self._build_points_index(weeks)
+        return index.get(player_id, {})
 
-        points_by_week: dict[int, float] = {}
+    @staticmethod
+    def _successful_faab(txn: Transaction) -> int:
+        """Get the FAAB bid a transaction spent, counting only successful waiver claims."""
+        if not (txn.is_waiver and txn.settings):
+            return 0
 
-        for week, matchups in matchups_by_week.items():
-            for matchup in matchups:
-                players_points = matchup.get("players_points", {})
-                if player_id in players_points:
-                    points_by_week[week] = float(players_points[player_id])
-                    break
+        # Failed claims have metadata indicating failure
+        notes = txn.metadata.get('notes') if txn.metadata else None
+        if notes and _FAILED_CLAIM_RE.search(notes):
+            return 0
 
-        return points_by_week
+        # FAAB bid is stored in settings, not waiver_budget
+        return txn.settings.get('waiver_bid', 0)
 
-    async def get_player_lifecycle(
-        self, player_id: str, weeks: int = 17
-    ) -> PlayerLifecycle:
+    async def _build_txn_index(self, weeks: int = 17) -> dict[str, list[Transaction]]:
         """
-        Track a player's complete journey through the league.
+        Index the season's add/drop transactions by player, built once per season length.
+
+        Returns:
+            Dict mapping player ID to the transactions adding or dropping them,
+            sorted by week
+        """
+        index = self._txn_index.get(weeks)
+        if index is None:
+            all_transactions = await self.ctx.get_all_transactions(weeks)
+
+            built: dict[str, list[Transaction]] = defaultdict(list)
+            for txn in sorted(all_transactions, key=lambda x: x.week):
+                adds = txn.adds or {}
+                for player_id in adds:
+                    built[player_id].append(txn)
+                for player_id in txn.drops or {}:
+                    if player_id not in adds:
+                        built[player_id].append(txn)
+
+            index = self._txn_index.setdefault(weeks, dict(built))
+        return index
+
+    async def _build_all_lifecycles(
+        self, player_ids: set[str], weeks: int = 17
+    ) -> dict[str, PlayerLifecycle]:
+        """
+        Track the lifecycles of many players from their indexed transactions.
 
         Args:
-            player_id: Player ID
+            player_ids: Players to track
             weeks: Number of weeks to analyze
 
         Returns:
-            PlayerLifecycle with all ownership periods
+            Dict mapping player ID to PlayerLifecycle
         """
-        # Get all transactions
-        all_transactions = await self.client.get_all_transactions(
-            self.ctx.league_id, weeks
+        if not player_ids:
+            return {}
+
+        txn_index, _ = await asyncio.gather(
+            self._build_txn_index(weeks), self._build_points_index(weeks)
         )
 
-        # Get player points by week
-        points_by_week = await self._get_player_points_by_week(player_id, weeks)
+        ownership_periods: dict[str, list[_Period]] = {}
+        for player_id in player_ids:
+            ownership_periods[player_id] = self._ownership_periods(
+                player_id, txn_index.get(player_id, []), weeks
+            )
+
+        lifecycles: dict[str, PlayerLifecycle] = {}
+        for player_id, periods in ownership_periods.items():
+            points_by_week = await self._get_player_points_by_week(player_id, weeks)
+            lifecycles[player_id] = self._lifecycle_from_periods(
+                player_id, periods, points_by_week, weeks
+            )
+
+        return lifecycles
 
-        # Track ownership changes
-        ownership_periods: list[dict[str, Any]] = []
+    def _ownership_periods(
+        self, player_id: str, events: list[Transaction], weeks: int
+    ) -> list[_Period]:
+        """Walk a player's week-sorted add/drop transactions into ownership periods."""
+        ownership_periods: list[_Period] = []
         current_owner: int | None = None
         current_period_start: int | None = None
         faab_spent: int = 0
 
-        for txn in sorted(all_transactions, key=lambda x: x.week):
+        for txn in events:
             # Check if this player was added
             if txn.adds and player_id in txn.adds:
-                new_owner = txn.adds[player_id]
-
                 # Close previous ownership period if exists
                 if current_owner is not None and current_period_start is not None:
-                    ownership_periods.append({
-                        "owner_roster_id": current_owner,
-                        "start_week": current_period_start,
-                        "end_week": txn.week - 1,
-                        "faab_spent": faab_spent,
-                    })
+                    ownership_periods.append(
+                        _Period(current_owner, current_period_start, txn.week - 1, faab_spent)
+                    )
 
                 # Start new ownership period
-                current_owner = new_owner
+                current_owner = txn.adds[player_id]
                 current_period_start = txn.week
+                faab_spent = self._successful_faab(txn)
 
-                # Extract FAAB spent (if waiver AND successful)
-                faab_spent = 0
-                if txn.is_waiver and txn.settings:
-                    # Only count SUCCESSFUL waiver claims
-                    # Failed claims have metadata indicating failure
-                    is_successful = True
-                    if txn.metadata and txn.metadata.get('notes'):
-                        notes = txn.metadata['notes'].lower()
-                        if 'claimed by another' in notes or 'failed' in notes or 'too many' in notes:
-                            is_successful = False
-
-                    if is_successful:
-                        # FAAB bid is stored in settings, not waiver_budget
-                        faab_spent = txn.settings.get('waiver_bid', 0)
-
-            # Check if this player was dropped
-            elif txn.drops and player_id in txn.drops:
-                dropping_owner = txn.drops[player_id]
-
+            # Otherwise this player was dropped
+            elif current_owner == txn.drops[player_id] and current_period_start is not None:
                 # Close ownership period
-                if current_owner == dropping_owner and current_period_start is not None:
-                    ownership_periods.append({
-                        "owner_roster_id": current_owner,
-                        "start_week": current_period_start,
-                        "end_week": txn.week,
-                        "faab_spent": faab_spent,
-                    })
-                    current_owner = None
-                    current_period_start = None
+                ownership_periods.append(
+                    _Period(current_owner, current_period_start, txn.week, faab_spent)
+                )
+                current_owner = None
+                current_period_start = None
 
         # Close final ownership period if still owned
         if current_owner is not None and current_period_start is not None:
-            ownership_periods.append({
-                "owner_roster_id": current_owner,
-                "start_week": current_period_start,
-                "end_week": weeks,
-                "faab_spent": faab_spent,
-            })
+            ownership_periods.append(
+                _Period(current_owner, current_period_start, weeks, faab_spent)
+            )
+
+        return ownership_periods
 
+    def _lifecycle_from_periods(
+        self,
+        player_id: str,
+        ownership_periods: list[_Period],
+        points_by_week: dict[int, float],
+        weeks: int,
+    ) -> PlayerLifecycle:
+        """Build a PlayerLifecycle from a player's raw ownership periods."""
         # Convert to PlayerOwnershipPeriod objects
         ownership_objects: list[PlayerOwnershipPeriod] = []
         player_name = self.ctx.get_player_name(player_id)
         player_position = self.ctx.get_player_position(player_id)
 
+        weekly_points = np.zeros(weeks + 1, dtype=np.float64)
+        for week, pts in points_by_week.items():
+            if 0 <= week <= weeks:
+                weekly_points[week] = pts
+
+        team_names = self._team_names
         for period in ownership_periods:
-            # Calculate points during ownership
+            owner_id = period.owner_roster_id
+
+            # Calculate points during ownership, summed in week order
             period_points = sum(
-                points_by_week.get(w, 0)
-                for w in range(period["start_week"], period["end_week"] + 1)
+                weekly_points[period.start_week:period.end_week + 1].tolist()
             )
 
-            weeks_owned = period["end_week"] - period["start_week"] + 1
+            weeks_owned = period.end_week - period.start_week + 1
             ppw = period_points / weeks_owned if weeks_owned > 0 else 0
 
             # Calculate ROI
-            if period["faab_spent"] > 0:
-                roi = period_points / period["faab_spent"]
+            if period.faab_spent > 0:
+                roi = period_points / period.faab_spent
             else:
                 roi = float('inf') if period_points > 0 else 0
 
@@ -157,11 +262,11 @@ class FAABService:
                     player_id=player_id,
                     player_name=player_name,
                     position=player_position,
-                    owner_roster_id=period["owner_roster_id"],
-                    owner_name=self.ctx.get_team_name(period["owner_roster_id"]),
-                    acquired_week=period["start_week"],
-                    dropped_week=period["end_week"] if period["end_week"] < weeks else None,
-                    faab_spent=period["faab_spent"],
+                    owner_roster_id=owner_id,
+                    owner_name=team_names.get(owner_id) or self.ctx.get_team_name(owner_id),
+                    acquired_week=period.start_week,
+                    dropped_week=period.end_week if period.end_week < weeks else None,
+                    faab_spent=period.faab_spent,
                     weeks_owned=weeks_owned,
                     points_during_ownership=round(period_points, 2),
                     points_per_week=round(ppw, 2),
@@ -170,9 +275,9 @@ class FAABService:
             )
 
         # Determine best/worst ROI owners
-        finite_roi_periods = [p for p in ownership_objects if p.roi < 999]
-        best_owner = max(finite_roi_periods, key=lambda x: x.roi).owner_name if finite_roi_periods else "N/A"
-        worst_owner = min(finite_roi_periods, key=lambda x: x.roi).owner_name if finite_roi_periods else None
+        best_period, worst_period, _, _ = _finite_roi_summary(ownership_objects)
+        best_owner = best_period.owner_name if best_period else "N/A"
+        worst_owner = worst_period.owner_name if worst_period else None
 
         return PlayerLifecycle(
             player_id=player_id,
@@ -187,8 +292,54 @@ class FAABService:
             worst_roi_owner=worst_owner,
         )
 
+    async def get_player_lifecycle(
+        self, player_id: str, weeks: int = 17
+    ) -> PlayerLifecycle:
+        """
+        Track a player's complete journey through the league.
+
+        Args:
+            player_id: Player ID
+            weeks: Number of weeks to analyze
+
+        Returns:
+            PlayerLifecycle with all ownership periods
+        """
+        lifecycles = await self._build_all_lifecycles({player_id}, weeks)
+        return lifecycles[player_id]
+
+    def _acquisitions_by_owner(
+        self, all_transactions: list[Transaction]
+    ) -> dict[int, list[dict[str, Any]]]:
+        """
+        Partition FAAB acquisitions (player, week, bid) by acquiring roster in one pass.
+
+        Returns:
+            Dict mapping roster ID to its acquisitions in transaction order
+        """
+        by_owner: dict[int, list[dict[str, Any]]] = defaultdict(list)
+
+        for txn in all_transactions:
+            if not txn.adds:
+                continue
+
+            faab = self._successful_faab(txn)
+            if faab > 0:  # Only track FAAB pickups, not free agents
+                for player_id, acquiring_roster in txn.adds.items():
+                    by_owner[acquiring_roster].append({
+                        "player_id": player_id,
+                        "week": txn.week,
+                        "faab": faab,
+                    })
+
+        return by_owner
+
     async def get_owner_faab_performance(
-        self, roster_id: int, weeks: int = 17
+        self,
+        roster_id: int,
+        weeks: int = 17,
+        lifecycles: dict[str, PlayerLifecycle] | None = None,
+        acquisitions: list[dict[str, Any]] | None = None,
     ) -> OwnerFAABPerformance:
         """
         Analyze FAAB efficiency for a specific owner.
@@ -196,6 +347,8 @@ class FAABService:
         Args:
             roster_id: Owner's roster ID
             weeks: Number of weeks to analyze
+            lifecycles: Prebuilt lifecycles covering this owner's acquisitions
+            acquisitions: This owner's FAAB acquisitions, if already partitioned
 
         Returns:
             OwnerFAABPerformance with all metrics
@@ -206,47 +359,21 @@ class FAABService:
         if roster and roster.settings:
             total_faab_spent = roster.settings.get('waiver_budget_used', 0)
 
-        # Get all transactions to track individual acquisitions
-        all_transactions = await self.client.get_all_transactions(
-            self.ctx.league_id, weeks
-        )
-
         # Track this owner's FAAB acquisitions (for detailed breakdown)
-        acquisitions: list[dict[str, Any]] = []
+        if acquisitions is None:
+            all_transactions = await self.ctx.get_all_transactions(weeks)
+            acquisitions = self._acquisitions_by_owner(all_transactions).get(roster_id, [])
 
-        for txn in all_transactions:
-            if not txn.adds:
-                continue
-
-            # Check if this owner acquired any players
-            for player_id, acquiring_roster in txn.adds.items():
-                if acquiring_roster == roster_id:
-                    # Determine FAAB spent (only for SUCCESSFUL waivers)
-                    faab = 0
-                    if txn.is_waiver and txn.settings:
-                        # Only count SUCCESSFUL waiver claims
-                        is_successful = True
-                        if txn.metadata and txn.metadata.get('notes'):
-                            notes = txn.metadata['notes'].lower()
-                            if 'claimed by another' in notes or 'failed' in notes or 'too many' in notes:
-                                is_successful = False
-
-                        if is_successful:
-                            # FAAB bid is stored in settings, not waiver_budget
-                            faab = txn.settings.get('waiver_bid', 0)
-
-                    if faab > 0:  # Only track FAAB pickups, not free agents
-                        acquisitions.append({
-                            "player_id": player_id,
-                            "week": txn.week,
-                            "faab": faab,
-                        })
+        if lifecycles is None:
+            lifecycles = await self._build_all_lifecycles(
+                {acq["player_id"] for acq in acquisitions}, weeks
+            )
 
         # Get details for each acquisition using lifecycle
         acquisition_periods: list[PlayerOwnershipPeriod] = []
 
         for acq in acquisitions:
-            lifecycle = await self.get_player_lifecycle(acq["player_id"], weeks)
+            lifecycle = lifecycles[acq["player_id"]]
             # Find the period that matches this acquisition
             for period in lifecycle.ownership_history:
                 if (period.owner_roster_id == roster_id and
@@ -254,18 +381,12 @@ class FAABService:
                     acquisition_periods.append(period)
                     break
 
-        # Calculate metrics
+        # Calculate metrics, with best and worst pickups
         total_points = sum(p.points_during_ownership for p in acquisition_periods)
-        avg_roi = (
-            sum(p.roi for p in acquisition_periods if p.roi < 999) / len([p for p in acquisition_periods if p.roi < 999])
-            if acquisition_periods and any(p.roi < 999 for p in acquisition_periods)
-            else 0
+        best_pickup, worst_pickup, roi_total, roi_count = _finite_roi_summary(
+            acquisition_periods
         )
-
-        # Find best and worst pickups
-        finite_acquisitions = [p for p in acquisition_periods if p.roi < 999]
-        best_pickup = max(finite_acquisitions, key=lambda x: x.roi) if finite_acquisitions else None
-        worst_pickup = min(finite_acquisitions, key=lambda x: x.roi) if finite_acquisitions else None
+        avg_roi = roi_total / roi_count if roi_count else 0
 
         # Get FAAB remaining (assume 100 budget)
         faab_remaining = 100 - total_faab_spent
@@ -294,9 +415,34 @@ class FAABService:
         Returns:
             LeagueFAABReport with all teams
         """
+        # Fetch transactions and index weekly points concurrently
+        all_transactions, _ = await asyncio.gather(
+            self.ctx.get_all_transactions(weeks), self._build_points_index(weeks)
+        )
+
+        # Most transacted players (top 10 by transaction count)
+        player_transaction_counts = Counter(
+            chain.from_iterable(txn.adds for txn in all_transactions if txn.adds)
+        )
+        most_transacted_player_ids = player_transaction_counts.most_common(10)
+
+        # Build lifecycles once for every FAAB acquisition and most transacted player
+        acquisitions_by_owner = self._acquisitions_by_owner(all_transactions)
+        tracked_ids = {pid for pid, _ in most_transacted_player_ids}
+        for roster in self.ctx.rosters:
+            tracked_ids.update(
+                acq["player_id"] for acq in acquisitions_by_owner.get(roster.roster_id, [])
+            )
+        lifecycles = await self._build_all_lifecycles(tracked_ids, weeks)
+
         # Get FAAB performance for all owners
         tasks = [
-            self.get_owner_faab_performance(roster.roster_id, weeks)
+            self.get_owner_faab_performance(
+                roster.roster_id,
+                weeks,
+                lifecycles,
+                acquisitions_by_owner.get(roster.roster_id, []),
+            )
             for roster in self.ctx.rosters
         ]
         owner_performances = await asyncio.gather(*tasks)
@@ -318,34 +464,12 @@ class FAABService:
         finite_pickups = [p for p in all_pickups if p.roi < 999]
 
         # Best value pickups
-        best_pickups = sorted(finite_pickups, key=lambda x: x.roi, reverse=True)[:20]
+        best_pickups = heapq.nlargest(20, finite_pickups, key=attrgetter("roi"))
 
         # Worst value pickups (overpays)
-        worst_pickups = sorted(finite_pickups, key=lambda x: x.roi)[:10]
-
-        # Most transacted players (get top 10 by transaction count)
-        all_transactions = await self.client.get_all_transactions(
-            self.ctx.league_id, weeks
-        )
+        worst_pickups = heapq.nsmallest(10, finite_pickups, key=attrgetter("roi"))
 
-        player_transaction_counts: dict[str, int] = defaultdict(int)
-        for txn in all_transactions:
-            if txn.adds:
-                for player_id in txn.adds.keys():
-                    player_transaction_counts[player_id] += 1
-
-        most_transacted_player_ids = sorted(
-            player_transaction_counts.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:10]
-
-        # Get lifecycles for most transacted players
-        lifecycle_tasks = [
-            self.get_player_lifecycle(pid, weeks)
-            for pid, _ in most_transacted_player_ids
-        ]
-        most_transacted = await asyncio.gather(*lifecycle_tasks)
+        most_transacted = [lifecycles[pid] for pid, _ in most_transacted_player_ids]
 
         return LeagueFAABReport(
             league_id=self.ctx.league_id,
@@ -4,10 +4,12 @@ Matchup Luck Analysis Service
 Analyzes strength of schedule, lucky wins, and unlucky losses.
 """
 
-import asyncio
 import statistics
+from collections import defaultdict
 from typing import Any
 
+import numpy as np
+
 from sleeper_analytics.clients.sleeper import LeagueContext, SleeperClient
 from sleeper_analytics.models.luck import (
     LeagueLuckReport,
@@ -15,6 +17,7 @@ from sleeper_analytics.models.luck import (
     StrengthOfSchedule,
     WeeklyLuckAnalysis,
 )
+from sleeper_analytics.models.matchup import Matchup
 from sleeper_analytics.services.matchups import MatchupService
 
 
@@ -29,6 +32,10 @@ class LuckAnalysisService:
         self.client = client
         self.ctx = context
         self.matchup_service = MatchupService(client, context)
+        self._weekly_luck: dict[int, dict[int, list[WeeklyLuckAnalysis]]] = {}
+        self._schedule: dict[
+            int, tuple[dict[int, dict[int, int]], dict[int, dict[int, tuple[int, float]]]]
+        ] = {}
 
     async def analyze_weekly_luck(self, week: int) -> list[WeeklyLuckAnalysis]:
         """
@@ -41,56 +48,76 @@ class LuckAnalysisService:
             List of WeeklyLuckAnalysis for all teams
         """
         matchups = await self.matchup_service.get_weekly_matchups(week)
+        return self._analyze_week(week, matchups)
+
+    async def _analyze_all_weeks(self, weeks: int) -> dict[int, list[WeeklyLuckAnalysis]]:
+        """
+        Analyze luck for every week of the season from one season matchup fetch.
+
+        Weeks without matchups are skipped. Results are cached per season length.
+
+        Returns:
+            Dict mapping roster ID to its WeeklyLuckAnalysis list in week order
+        """
+        by_roster = self._weekly_luck.get(weeks)
+        if by_roster is None:
+            season_matchups = await self.matchup_service.get_season_matchups(1, weeks)
 
+            analyses: dict[int, list[WeeklyLuckAnalysis]] = defaultdict(list)
+            for week, matchups in season_matchups.items():
+                if matchups:
+                    for analysis in self._analyze_week(week, matchups):
+                        analyses[analysis.roster_id].append(analysis)
+
+            by_roster = self._weekly_luck.setdefault(weeks, dict(analyses))
+        return by_roster
+
+    def _analyze_week(self, week: int, matchups: list[Matchup]) -> list[WeeklyLuckAnalysis]:
+        """Analyze luck for all teams from a week's matchups."""
         # Collect all scores for this week
         all_scores: list[tuple[int, str, float, str]] = []  # (roster_id, team, points, result)
         matchup_results: dict[int, tuple[str, float, str]] = {}  # roster_id -> (result, opp_points, opp_name)
 
         for matchup in matchups:
-            # Team 1
-            all_scores.append((
-                matchup.team1.roster_id,
-                matchup.team1.team_name,
-                matchup.team1.points,
-                "W" if matchup.team1.points > matchup.team2.points else ("L" if matchup.team1.points < matchup.team2.points else "T")
-            ))
-            matchup_results[matchup.team1.roster_id] = (
-                "W" if matchup.team1.points > matchup.team2.points else ("L" if matchup.team1.points < matchup.team2.points else "T"),
-                matchup.team2.points,
-                matchup.team2.team_name
+            team1, team2 = matchup.team1, matchup.team2
+            result1 = (
+                "W" if team1.points > team2.points
+                else ("L" if team1.points < team2.points else "T")
             )
+            result2 = "L" if result1 == "W" else ("W" if result1 == "L" else "T")
+
+            # Team 1
+            all_scores.append((team1.roster_id, team1.team_name, team1.points, result1))
+            matchup_results[team1.roster_id] = (result1, team2.points, team2.team_name)
 
             # Team 2
-            all_scores.append((
-                matchup.team2.roster_id,
-                matchup.team2.team_name,
-                matchup.team2.points,
-                "W" if matchup.team2.points > matchup.team1.points else ("L" if matchup.team2.points < matchup.team1.points else "T")
-            ))
-            matchup_results[matchup.team2.roster_id] = (
-                "W" if matchup.team2.points > matchup.team1.points else ("L" if matchup.team2.points < matchup.team1.points else "T"),
-                matchup.team1.points,
-                matchup.team1.team_name
-            )
+            all_scores.append((team2.roster_id, team2.team_name, team2.points, result2))
+            matchup_results[team2.roster_id] = (result2, team1.points, team1.team_name)
+
+        if not all_scores:
+            return []
 
         # Calculate median score
-        scores_only = [s[2] for s in all_scores]
-        league_median = statistics.median(scores_only)
+        scores = np.fromiter((s[2] for s in all_scores), dtype=np.float64, count=len(all_scores))
+        league_median = float(np.median(scores))
 
-        # Sort by points to get ranks
-        sorted_scores = sorted(all_scores, key=lambda x: x[2], reverse=True)
-        rank_map = {roster_id: rank + 1 for rank, (roster_id, _, _, _) in enumerate(sorted_scores)}
+        # Rank by points (ties keep matchup order)
+        order = np.argsort(-scores, kind="stable")
+        rank_map = {all_scores[i][0]: rank + 1 for rank, i in enumerate(order.tolist())}
+
+        # Count how many teams each would beat if they played everyone
+        # (scores strictly below theirs, which never includes their own)
+        wins_vs_all_scores = np.searchsorted(np.sort(scores), scores, side="left").tolist()
 
         # Analyze each team
         analyses: list[WeeklyLuckAnalysis] = []
         total_teams = len(all_scores)
 
-        for roster_id, team_name, points, actual_result in all_scores:
+        for (roster_id, team_name, points, actual_result), wins_vs_all in zip(
+            all_scores, wins_vs_all_scores, strict=True
+        ):
             result_info, opp_points, opp_name = matchup_results[roster_id]
 
-            # Count how many teams they'd beat if they played everyone
-            wins_vs_all = sum(1 for _, _, opp_score, _ in all_scores if roster_id != _ and points > opp_score)
-
             expected_win_pct = wins_vs_all / (total_teams - 1) if total_teams > 1 else 0
 
             # Determine luck factor
@@ -126,6 +153,41 @@ class LuckAnalysisService:
 
         return analyses
 
+    async def _schedule_index(
+        self, weeks: int
+    ) -> tuple[dict[int, dict[int, int]], dict[int, dict[int, tuple[int, float]]]]:
+        """
+        Index every week's score ranks and opponents once for all teams.
+
+        Returns:
+            Tuple of (week -> {roster_id: rank}, week -> {roster_id: (opponent
+            roster_id, opponent points)}), cached per season length
+        """
+        index = self._schedule.get(weeks)
+        if index is None:
+            season_matchups = await self.matchup_service.get_season_matchups(1, weeks)
+
+            week_ranks: dict[int, dict[int, int]] = {}
+            week_opponents: dict[int, dict[int, tuple[int, float]]] = {}
+
+            for week, matchups in season_matchups.items():
+                # Get all scores for this week to calculate ranks
+                all_week_scores = []
+                opponents: dict[int, tuple[int, float]] = {}
+                for m in matchups:
+                    all_week_scores.append((m.team1.roster_id, m.team1.points))
+                    all_week_scores.append((m.team2.roster_id, m.team2.points))
+                    opponents.setdefault(m.team1.roster_id, (m.team2.roster_id, m.team2.points))
+                    opponents.setdefault(m.team2.roster_id, (m.team1.roster_id, m.team1.points))
+
+                # Sort to get ranks
+                all_week_scores.sort(key=lambda x: x[1], reverse=True)
+                week_ranks[week] = {rid: idx + 1 for idx, (rid, _) in enumerate(all_week_scores)}
+                week_opponents[week] = opponents
+
+            index = self._schedule.setdefault(weeks, (week_ranks, week_opponents))
+        return index
+
     async def calculate_strength_of_schedule(
         self, roster_id: int, weeks: int = 17
     ) -> StrengthOfSchedule:
@@ -139,39 +201,28 @@ class LuckAnalysisService:
         Returns:
             StrengthOfSchedule with metrics
         """
-        season_matchups = await self.matchup_service.get_season_matchups(1, weeks)
-
+        week_ranks, week_opponents = await self._schedule_index(weeks)
+        return self._compute_strength_of_schedule(roster_id, week_ranks, week_opponents)
+
+    def _compute_strength_of_schedule(
+        self,
+        roster_id: int,
+        week_ranks: dict[int, dict[int, int]],
+        week_opponents: dict[int, dict[int, tuple[int, float]]],
+    ) -> StrengthOfSchedule:
+        """Build a team's strength of schedule from the indexed weekly ranks and opponents."""
         opponent_scores: list[float] = []
         opponent_ranks: list[int] = []
         week_difficulty: list[tuple[int, float]] = []  # (week, opp_score)
 
-        for week, matchups in season_matchups.items():
-            # Get all scores for this week to calculate ranks
-            all_week_scores = []
-            for m in matchups:
-                all_week_scores.append((m.team1.roster_id, m.team1.points))
-                all_week_scores.append((m.team2.roster_id, m.team2.points))
-
-            # Sort to get ranks
-            all_week_scores.sort(key=lambda x: x[1], reverse=True)
-            rank_map = {rid: idx + 1 for idx, (rid, _) in enumerate(all_week_scores)}
-
+        for week, opponents in week_opponents.items():
             # Find this team's opponent
-            for matchup in matchups:
-                if matchup.team1.roster_id == roster_id:
-                    opp_points = matchup.team2.points
-                    opp_rank = rank_map.get(matchup.team2.roster_id, 99)
-                    opponent_scores.append(opp_points)
-                    opponent_ranks.append(opp_rank)
-                    week_difficulty.append((week, opp_points))
-                    break
-                elif matchup.team2.roster_id == roster_id:
-                    opp_points = matchup.team1.points
-                    opp_rank = rank_map.get(matchup.team1.roster_id, 99)
-                    opponent_scores.append(opp_points)
-                    opponent_ranks.append(opp_rank)
-                    week_difficulty.append((week, opp_points))
-                    break
+            opponent = opponents.get(roster_id)
+            if opponent is not None:
+                opp_roster_id, opp_points = opponent
+                opponent_scores.append(opp_points)
+                opponent_ranks.append(week_ranks[week].get(opp_roster_id, 99))
+                week_difficulty.append((week, opp_points))
 
         # Calculate averages
         avg_opp_points = statistics.mean(opponent_scores) if opponent_scores else 0
@@ -204,37 +255,46 @@ class LuckAnalysisService:
         Returns:
             LuckReport with all luck metrics
         """
-        # Analyze all weeks concurrently
-        tasks = [self.analyze_weekly_luck(week) for week in range(1, weeks + 1)]
-        all_weekly_analyses = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Filter out exceptions and find this team's analyses
-        team_weekly: list[WeeklyLuckAnalysis] = []
-        for weekly in all_weekly_analyses:
-            if isinstance(weekly, list):
-                for analysis in weekly:
-                    if analysis.roster_id == roster_id:
-                        team_weekly.append(analysis)
-
-        # Calculate actual record
-        actual_wins = sum(1 for w in team_weekly if w.actual_result == "W")
-        actual_losses = sum(1 for w in team_weekly if w.actual_result == "L")
-        actual_ties = sum(1 for w in team_weekly if w.actual_result == "T")
-
-        # Calculate expected wins (based on median)
-        expected_wins = sum(
-            1 for w in team_weekly if w.points_scored > w.league_median
+        weekly_by_roster = await self._analyze_all_weeks(weeks)
+        week_ranks, week_opponents = await self._schedule_index(weeks)
+        return self._compute_luck_report(
+            roster_id, weeks, weekly_by_roster, week_ranks, week_opponents
         )
 
-        # Find lucky wins and unlucky losses
-        lucky_wins = [w for w in team_weekly if w.luck_factor == "lucky_win"]
-        unlucky_losses = [w for w in team_weekly if w.luck_factor == "unlucky_loss"]
+    def _compute_luck_report(
+        self,
+        roster_id: int,
+        weeks: int,
+        weekly_by_roster: dict[int, list[WeeklyLuckAnalysis]],
+        week_ranks: dict[int, dict[int, int]],
+        week_opponents: dict[int, dict[int, tuple[int, float]]],
+    ) -> LuckReport:
+        """Build a team's luck report from the season's analyses and schedule index."""
+        team_weekly = weekly_by_roster.get(roster_id, [])
+
+        # Tally the actual record, expected wins (based on median), lucky wins
+        # and unlucky losses in one pass
+        actual_wins = actual_losses = actual_ties = expected_wins = 0
+        lucky_wins: list[WeeklyLuckAnalysis] = []
+        unlucky_losses: list[WeeklyLuckAnalysis] = []
+
+        for w in team_weekly:
+            result = w.actual_result
+            actual_wins += result == "W"
+            actual_losses += result == "L"
+            actual_ties += result == "T"
+            expected_wins += w.points_scored > w.league_median
+
+            if w.luck_factor == "lucky_win":
+                lucky_wins.append(w)
+            elif w.luck_factor == "unlucky_loss":
+                unlucky_losses.append(w)
 
         # Calculate luck score
         luck_score = actual_wins - expected_wins
 
         # Get strength of schedule
-        sos = await self.calculate_strength_of_schedule(roster_id, weeks)
+        sos = self._compute_strength_of_schedule(roster_id, week_ranks, week_opponents)
 
         return LuckReport(
             roster_id=roster_id,
@@ -263,12 +323,16 @@ class LuckAnalysisService:
         Returns:
             LeagueLuckReport with all teams
         """
-        # Get luck reports for all teams
-        tasks = [
-            self.get_luck_report(roster.roster_id, weeks)
+        # Analyze the season once, then build every team's report from it
+        weekly_by_roster = await self._analyze_all_weeks(weeks)
+        week_ranks, week_opponents = await self._schedule_index(weeks)
+
+        team_reports = [
+            self._compute_luck_report(
+                roster.roster_id, weeks, weekly_by_roster, week_ranks, week_opponents
+            )
             for roster in self.ctx.rosters
         ]
-        team_reports = await asyncio.gather(*tasks)
 
         # Calculate SOS ranks
         sos_list = [(r.roster_id, r.strength_of_schedule.avg_opponent_points) for r in team_reports]
@@ -4,8 +4,9 @@ Matchup Analysis Service
 Provides matchup analysis, standings, and team performance metrics.
 """
 
-from collections import defaultdict
-from typing import Any
+from collections import Counter, defaultdict
+from operator import itemgetter
+from typing import Any, NamedTuple
 
 import numpy as np
 
@@ -19,6 +20,22 @@ from sleeper_analytics.models.matchup import (
     WeeklyResult,
 )
 
+_by_points = itemgetter(2)
+_by_margin = itemgetter("margin")
+
+
+class _MatchupRow(NamedTuple):
+    """A paired matchup reduced to the fields the season aggregations read."""
+
+    week: int
+    matchup_id: int
+    roster_id1: int
+    team1: str
+    points1: float
+    roster_id2: int
+    team2: str
+    points2: float
+
 
 class MatchupService:
     """
@@ -34,6 +51,21 @@ class MatchupService:
     def __init__(self, client: SleeperClient, context: LeagueContext):
         self.client = client
         self.ctx = context
+        self._season_cache: dict[tuple[int, int], dict[int, list[Matchup]]] = {}
+        self._rows_cache: dict[tuple[int, int], dict[int, list[_MatchupRow]]] = {}
+        self._roster_index_cache: dict[
+            tuple[int, int], dict[int, list[tuple[int, float, float, str, int]]]
+        ] = {}
+        # Team names resolved once, for the per-matchup and per-team lookups
+        self._team_names = {
+            r.roster_id: context.get_team_name(r.roster_id) for r in context.rosters
+        }
+
+    def invalidate(self) -> None:
+        """Drop cached season matchups so the next request rebuilds them."""
+        self._season_cache.clear()
+        self._rows_cache.clear()
+        self._roster_index_cache.clear()
 
     async def get_weekly_matchups(self, week: int) -> list[Matchup]:
         """
@@ -46,43 +78,85 @@ class MatchupService:
             List of Matchup objects with both teams
         """
         raw_matchups = await self.client.get_matchups(self.ctx.league_id, week)
+        return self._build_matchups(week, raw_matchups)
 
-        # Group by matchup_id
-        matchup_groups: dict[int, list[dict]] = defaultdict(list)
-        for m in raw_matchups:
-            matchup_id = m.get("matchup_id")
-            if matchup_id is not None:
-                matchup_groups[matchup_id].append(m)
+    def _build_matchups(self, week: int, raw_matchups: list[dict]) -> list[Matchup]:
+        """
+        Pair a week's raw matchup entries into Matchup objects.
+
+        Entries are grouped by matchup_id; groups without exactly two teams are skipped.
+        """
+        names = self._team_names
+        get_name = self.ctx.get_team_name
 
         matchups = []
-        for matchup_id, teams in matchup_groups.items():
-            if len(teams) == 2:
-                team1_data, team2_data = teams
-
-                team1 = MatchupTeam(
-                    roster_id=team1_data["roster_id"],
-                    team_name=self.ctx.get_team_name(team1_data["roster_id"]),
-                    points=team1_data.get("points") or 0,
-                    starters=team1_data.get("starters") or [],
-                    players=team1_data.get("players") or [],
-                    players_points=team1_data.get("players_points") or {},
-                )
+        for matchup_id, team1_data, team2_data in self._pair_teams(raw_matchups):
+            team1_rid = team1_data["roster_id"]
+            team1 = MatchupTeam(
+                roster_id=team1_rid,
+                team_name=names.get(team1_rid) or get_name(team1_rid),
+                points=team1_data.get("points") or 0,
+                starters=team1_data.get("starters") or [],
+                players=team1_data.get("players") or [],
+                players_points=team1_data.get("players_points") or {},
+            )
 
-                team2 = MatchupTeam(
-                    roster_id=team2_data["roster_id"],
-                    team_name=self.ctx.get_team_name(team2_data["roster_id"]),
-                    points=team2_data.get("points") or 0,
-                    starters=team2_data.get("starters") or [],
-                    players=team2_data.get("players") or [],
-                    players_points=team2_data.get("players_points") or {},
-                )
+            team2_rid = team2_data["roster_id"]
+            team2 = MatchupTeam(
+                roster_id=team2_rid,
+                team_name=names.get(team2_rid) or get_name(team2_rid),
+                points=team2_data.get("points") or 0,
+                starters=team2_data.get("starters") or [],
+                players=team2_data.get("players") or [],
+                players_points=team2_data.get("players_points") or {},
+            )
 
-                matchups.append(
-                    Matchup(week=week, matchup_id=matchup_id, team1=team1, team2=team2)
-                )
+            matchups.append(
+                Matchup(week=week, matchup_id=matchup_id, team1=team1, team2=team2)
+            )
 
         return matchups
 
+    @staticmethod
+    def _pair_teams(raw_matchups: list[dict]) -> list[tuple[int, dict, dict]]:
+        """Group a week's raw entries by matchup_id, keeping groups of exactly two teams."""
+        matchup_groups: dict[int, list[dict]] = defaultdict(list)
+        for m in raw_matchups:
+            matchup_id = m.get("matchup_id")
+            if matchup_id is None:
+                continue
+            matchup_groups[matchup_id].append(m)
+
+        return [
+            (matchup_id, *teams)
+            for matchup_id, teams in matchup_groups.items()
+            if len(teams) == 2
+        ]
+
+    def _build_rows(self, week: int, raw_matchups: list[dict]) -> list[_MatchupRow]:
+        """Pair a week's raw matchup entries into rows, without building models."""
+        names = self._team_names
+        get_name = self.ctx.get_team_name
+
+        rows: list[_MatchupRow] = []
+        append = rows.append
+        for matchup_id, team1_data, team2_data in self._pair_teams(raw_matchups):
+            team1_rid = team1_data["roster_id"]
+            team2_rid = team2_data["roster_id"]
+            append(
+                _MatchupRow(
+                    week,
+                    matchup_id,
+                    team1_rid,
+                    names.get(team1_rid) or get_name(team1_rid),
+                    float(team1_data.get("points") or 0),
+                    team2_rid,
+                    names.get(team2_rid) or get_name(team2_rid),
+                    float(team2_data.get("points") or 0),
+                )
+            )
+        return rows
+
     async def get_season_matchups(
         self, start_week: int = 1, end_week: int = 17
     ) -> dict[int, list[Matchup]]:
@@ -96,49 +170,71 @@ class MatchupService:
         Returns:
             Dict mapping week number to list of Matchup objects
         """
-        matchups_by_week = await self.client.get_matchups_range(
-            self.ctx.league_id, start_week, end_week
-        )
+        cached = self._season_cache.get((start_week, end_week))
+        if cached is not None:
+            return cached
+
+        matchups_by_week = await self.ctx.get_matchups_range(start_week, end_week)
+
+        result = {
+            week: self._build_matchups(week, raw_matchups)
+            for week, raw_matchups in matchups_by_week.items()
+        }
+
+        return self._season_cache.setdefault((start_week, end_week), result)
 
-        result = {}
-        for week, raw_matchups in matchups_by_week.items():
-            # Group by matchup_id
-            matchup_groups: dict[int, list[dict]] = defaultdict(list)
-            for m in raw_matchups:
-                matchup_id = m.get("matchup_id")
-                if matchup_id is not None:
-                    matchup_groups[matchup_id].append(m)
-
-            week_matchups = []
-            for matchup_id, teams in matchup_groups.items():
-                if len(teams) == 2:
-                    team1_data, team2_data = teams
-
-                    team1 = MatchupTeam(
-                        roster_id=team1_data["roster_id"],
-                        team_name=self.ctx.get_team_name(team1_data["roster_id"]),
-                        points=team1_data.get("points") or 0,
-                        starters=team1_data.get("starters") or [],
-                        players=team1_data.get("players") or [],
-                        players_points=team1_data.get("players_points") or {},
-                    )
-
-                    team2 = MatchupTeam(
-                        roster_id=team2_data["roster_id"],
-                        team_name=self.ctx.get_team_name(team2_data["roster_id"]),
-                        points=team2_data.get("points") or 0,
-                        starters=team2_data.get("starters") or [],
-                        players=team2_data.get("players") or [],
-                        players_points=team2_data.get("players_points") or {},
-                    )
-
-                    week_matchups.append(
-                        Matchup(week=week, matchup_id=matchup_id, team1=team1, team2=team2)
-                    )
-
-            result[week] = week_matchups
-
-        return result
+    async def _get_season_rows(
+        self, start_week: int = 1, end_week: int = 17
+    ) -> dict[int, list[_MatchupRow]]:
+        """
+        Get the season's matchups as rows, built once per week range.
+
+        Returns:
+            Dict mapping week number to that week's matchup rows
+        """
+        key = (start_week, end_week)
+        rows = self._rows_cache.get(key)
+        if rows is None:
+            matchups_by_week = await self.ctx.get_matchups_range(start_week, end_week)
+            rows = self._rows_cache.setdefault(
+                key,
+                {
+                    week: self._build_rows(week, raw_matchups)
+                    for week, raw_matchups in matchups_by_week.items()
+                },
+            )
+        return rows
+
+    async def _get_roster_index(
+        self, start_week: int = 1, end_week: int = 17
+    ) -> dict[int, list[tuple[int, float, float, str, int]]]:
+        """
+        Index the season's games by roster, built once per week range.
+
+        Returns:
+            Dict mapping roster ID to (week, points, opponent points, opponent
+            name, opponent roster ID) tuples in week order
+        """
+        key = (start_week, end_week)
+        index = self._roster_index_cache.get(key)
+        if index is None:
+            season_rows = await self._get_season_rows(start_week, end_week)
+            index = self._roster_index_cache.setdefault(
+                key, self._build_roster_index(season_rows)
+            )
+        return index
+
+    @staticmethod
+    def _build_roster_index(
+        season_rows: dict[int, list[_MatchupRow]],
+    ) -> dict[int, list[tuple[int, float, float, str, int]]]:
+        """Walk each matchup once, recording the game from both teams' sides."""
+        index: dict[int, list[tuple[int, float, float, str, int]]] = defaultdict(list)
+        for week, rows in season_rows.items():
+            for _, _, rid1, team1, pts1, rid2, team2, pts2 in rows:
+                index[rid1].append((week, pts1, pts2, team2, rid2))
+                index[rid2].append((week, pts2, pts1, team1, rid1))
+        return dict(index)
 
     async def get_team_performance(
         self, roster_id: int, weeks: int = 17
@@ -153,60 +249,48 @@ class MatchupService:
         Returns:
             TeamPerformance object with detailed stats
         """
-        season_matchups = await self.get_season_matchups(1, weeks)
+        roster_index = await self._get_roster_index(1, weeks)
+        return self._team_performance(roster_id, roster_index.get(roster_id, []))
 
-        wins, losses, ties = 0, 0, 0
+    def _team_performance(
+        self, roster_id: int, games: list[tuple[int, float, float, str, int]]
+    ) -> TeamPerformance:
+        """Build a team's season performance from its indexed games."""
+        count = len(games)
+        arr = np.fromiter(
+            (pts for game in games for pts in game[1:3]), dtype=np.float64, count=2 * count
+        ).reshape(-1, 2)
+        my_pts, opp_pts = arr[:, 0], arr[:, 1]
+
+        wins = int(np.count_nonzero(my_pts > opp_pts))
+        losses = int(np.count_nonzero(my_pts < opp_pts))
+        ties = count - wins - losses
+
+        # Totals accumulate in week order so rounded averages match game-by-game addition
         total_points_for = 0.0
         total_points_against = 0.0
-        weekly_points: list[float] = []
-        weekly_results: list[WeeklyResult] = []
-
-        for week in range(1, weeks + 1):
-            matchups = season_matchups.get(week, [])
-
-            for matchup in matchups:
-                if matchup.team1.roster_id == roster_id:
-                    my_points = matchup.team1.points
-                    opp_points = matchup.team2.points
-                    opponent = matchup.team2.team_name
-                elif matchup.team2.roster_id == roster_id:
-                    my_points = matchup.team2.points
-                    opp_points = matchup.team1.points
-                    opponent = matchup.team1.team_name
-                else:
-                    continue
-
-                total_points_for += my_points
-                total_points_against += opp_points
-                weekly_points.append(my_points)
-
-                if my_points > opp_points:
-                    result = "W"
-                    wins += 1
-                elif my_points < opp_points:
-                    result = "L"
-                    losses += 1
-                else:
-                    result = "T"
-                    ties += 1
-
-                weekly_results.append(
-                    WeeklyResult(
-                        week=week,
-                        points=my_points,
-                        opponent=opponent,
-                        opponent_points=opp_points,
-                        result=result,
-                    )
-                )
-
-        games = wins + losses + ties
-        avg_points = total_points_for / games if games > 0 else 0
-        consistency = float(np.std(weekly_points)) if len(weekly_points) > 1 else 0
+        for _, my_points, opp_points, _, _ in games:
+            total_points_for += my_points
+            total_points_against += opp_points
+        avg_points = total_points_for / count if count > 0 else 0
+        consistency = float(np.std(my_pts)) if count > 1 else 0
+
+        weekly_results = [
+            WeeklyResult(
+                week=week,
+                points=my_points,
+                opponent=opponent,
+                opponent_points=opp_points,
+                result=(
+                    "W" if my_points > opp_points else "L" if my_points < opp_points else "T"
+                ),
+            )
+            for week, my_points, opp_points, opponent, _ in games
+        ]
 
         return TeamPerformance(
             roster_id=roster_id,
-            team_name=self.ctx.get_team_name(roster_id),
+            team_name=self._team_names.get(roster_id) or self.ctx.get_team_name(roster_id),
             wins=wins,
             losses=losses,
             ties=ties,
@@ -227,11 +311,12 @@ class MatchupService:
         Returns:
             List of Standing objects, sorted by rank
         """
-        standings = []
-
-        for roster in self.ctx.rosters:
-            perf = await self.get_team_performance(roster.roster_id, weeks)
-            standings.append(perf)
+        # Index the season once and build every team's performance from it
+        roster_index = await self._get_roster_index(1, weeks)
+        standings = [
+            self._team_performance(roster.roster_id, roster_index.get(roster.roster_id, []))
+            for roster in self.ctx.rosters
+        ]
 
         # Sort by wins (desc), then points for (desc)
         standings.sort(key=lambda x: (x.wins, x.points_for), reverse=True)
@@ -265,23 +350,25 @@ class MatchupService:
         Returns:
             List of close game dictionaries sorted by margin
         """
-        season_matchups = await self.get_season_matchups(1, weeks)
+        season_rows = await self._get_season_rows(1, weeks)
 
         close_games = []
-        for week, matchups in season_matchups.items():
-            for matchup in matchups:
-                if matchup.margin <= threshold:
-                    close_games.append({
-                        "week": week,
-                        "team1": matchup.team1.team_name,
-                        "team1_points": matchup.team1.points,
-                        "team2": matchup.team2.team_name,
-                        "team2_points": matchup.team2.points,
-                        "margin": round(matchup.margin, 2),
-                        "winner": matchup.winner.team_name if matchup.winner else "Tie",
-                    })
-
-        close_games.sort(key=lambda x: x["margin"])
+        for week, rows in season_rows.items():
+            for _, _, _, team1, pts1, _, team2, pts2 in rows:
+                margin = abs(pts1 - pts2)
+                if margin > threshold:
+                    continue
+                close_games.append({
+                    "week": week,
+                    "team1": team1,
+                    "team1_points": pts1,
+                    "team2": team2,
+                    "team2_points": pts2,
+                    "margin": round(margin, 2),
+                    "winner": team1 if pts1 > pts2 else team2 if pts2 > pts1 else "Tie",
+                })
+
+        close_games.sort(key=_by_margin)
         return close_games
 
     async def get_best_worst_weeks(
@@ -321,43 +408,37 @@ class MatchupService:
         Returns:
             Head-to-head record and matchup history
         """
-        season_matchups = await self.get_season_matchups(1, weeks)
+        roster_index = await self._get_roster_index(1, weeks)
 
-        team1_name = self.ctx.get_team_name(roster_id_1)
-        team2_name = self.ctx.get_team_name(roster_id_2)
+        names = self._team_names
+        team1_name = names.get(roster_id_1) or self.ctx.get_team_name(roster_id_1)
+        team2_name = names.get(roster_id_2) or self.ctx.get_team_name(roster_id_2)
 
         matchups_history = []
         team1_wins = 0
         team2_wins = 0
         ties = 0
 
-        for week, matchups in season_matchups.items():
-            for matchup in matchups:
-                roster_ids = {matchup.team1.roster_id, matchup.team2.roster_id}
-                if roster_id_1 in roster_ids and roster_id_2 in roster_ids:
-                    if matchup.team1.roster_id == roster_id_1:
-                        t1_pts = matchup.team1.points
-                        t2_pts = matchup.team2.points
-                    else:
-                        t1_pts = matchup.team2.points
-                        t2_pts = matchup.team1.points
-
-                    if t1_pts > t2_pts:
-                        team1_wins += 1
-                        winner = team1_name
-                    elif t2_pts > t1_pts:
-                        team2_wins += 1
-                        winner = team2_name
-                    else:
-                        ties += 1
-                        winner = "Tie"
-
-                    matchups_history.append({
-                        "week": week,
-                        f"{team1_name}_points": t1_pts,
-                        f"{team2_name}_points": t2_pts,
-                        "winner": winner,
-                    })
+        for week, t1_pts, t2_pts, _, opp_roster_id in roster_index.get(roster_id_1, []):
+            if opp_roster_id != roster_id_2:
+                continue
+
+            if t1_pts > t2_pts:
+                team1_wins += 1
+                winner = team1_name
+            elif t2_pts > t1_pts:
+                team2_wins += 1
+                winner = team2_name
+            else:
+                ties += 1
+                winner = "Tie"
+
+            matchups_history.append({
+                "week": week,
+                f"{team1_name}_points": t1_pts,
+                f"{team2_name}_points": t2_pts,
+                "winner": winner,
+            })
 
         return {
             "team1": team1_name,
@@ -378,33 +459,33 @@ class MatchupService:
         Returns:
             WeeklyAward with high and low scorers
         """
-        matchups = await self.get_weekly_matchups(week)
-
-        if not matchups:
+        for (start_week, end_week), season_rows in self._rows_cache.items():
+            if start_week <= week <= end_week:
+                rows = season_rows.get(week, [])
+                break
+        else:
+            raw_matchups = await self.client.get_matchups(self.ctx.league_id, week)
+            rows = self._build_rows(week, raw_matchups)
+
+        award = self._weekly_award(week, rows)
+        if award is None:
             raise ValueError(f"No matchups found for week {week}")
+        return award
+
+    @staticmethod
+    def _weekly_award(week: int, rows: list[_MatchupRow]) -> WeeklyAward | None:
+        """Pick a week's high and low scorers, or None if the week has no matchups."""
+        if not rows:
+            return None
 
-        # Collect all team scores
         all_scores: list[tuple[int, str, float]] = []
-        for matchup in matchups:
-            all_scores.append((
-                matchup.team1.roster_id,
-                matchup.team1.team_name,
-                matchup.team1.points
-            ))
-            all_scores.append((
-                matchup.team2.roster_id,
-                matchup.team2.team_name,
-                matchup.team2.points
-            ))
-
-        # Sort by points
-        all_scores.sort(key=lambda x: x[2])
-
-        # Lowest scorer
-        low_roster_id, low_team, low_score = all_scores[0]
-
-        # Highest scorer
-        high_roster_id, high_team, high_score = all_scores[-1]
+        for _, _, rid1, team1, pts1, rid2, team2, pts2 in rows:
+            all_scores.append((rid1, team1, pts1))
+            all_scores.append((rid2, team2, pts2))
+
+        # Ties go to the first lowest and the last highest score, as with a stable sort
+        low_roster_id, low_team, low_score = min(all_scores, key=_by_points)
+        high_roster_id, high_team, high_score = max(reversed(all_scores), key=_by_points)
 
         return WeeklyAward(
             week=week,
@@ -426,51 +507,34 @@ class MatchupService:
         Returns:
             SeasonAwardsReport with all weekly awards and payout calculations
         """
-        # Fetch all weekly awards concurrently
-        import asyncio
-
-        tasks = [self.get_weekly_high_low(week) for week in range(1, weeks + 1)]
-        weekly_awards = await asyncio.gather(*tasks, return_exceptions=True)
+        season_rows = await self._get_season_rows(1, weeks)
 
-        # Filter out any exceptions (weeks with no matchups)
+        # Weeks with no matchups produce no award
         valid_awards = [
-            award for award in weekly_awards
-            if isinstance(award, WeeklyAward)
+            award
+            for week, rows in season_rows.items()
+            if (award := self._weekly_award(week, rows)) is not None
         ]
 
         # Count high and low score occurrences
-        high_score_counts: dict[str, int] = {}
-        low_score_counts: dict[str, int] = {}
-
-        for award in valid_awards:
-            high_score_counts[award.high_scorer] = (
-                high_score_counts.get(award.high_scorer, 0) + 1
-            )
-            low_score_counts[award.low_scorer] = (
-                low_score_counts.get(award.low_scorer, 0) + 1
-            )
+        high_score_counts = Counter(award.high_scorer for award in valid_awards)
+        low_score_counts = Counter(award.low_scorer for award in valid_awards)
 
         # Calculate net payouts (high scorers get $5, low scorers pay $5)
         # Include ALL teams in the league, even if they never got high/low scorer
-        payout_by_team: dict[str, float] = {}
-
-        # Get all team names from league context
-        all_team_names = [self.ctx.get_team_name(roster.roster_id) for roster in self.ctx.rosters]
-
-        for team_name in all_team_names:
-            high_count = high_score_counts.get(team_name, 0)
-            low_count = low_score_counts.get(team_name, 0)
-            net_payout = (high_count * 5.0) - (low_count * 5.0)
-            payout_by_team[team_name] = net_payout
+        payout_by_team = {
+            team_name: (high_score_counts[team_name] - low_score_counts[team_name]) * 5.0
+            for team_name in self._team_names.values()
+        }
 
         return SeasonAwardsReport(
             league_id=self.ctx.league_id,
             league_name=self.ctx.league_name,
             weeks_analyzed=len(valid_awards),
             weekly_awards=valid_awards,
-            high_score_leaders=high_score_counts,
-            low_score_leaders=low_score_counts,
-            total_payout_high=sum(high_score_counts.values()) * 5.0,
-            total_payout_low=sum(low_score_counts.values()) * 5.0,
+            high_score_leaders=dict(high_score_counts),
+            low_score_leaders=dict(low_score_counts),
+            total_payout_high=high_score_counts.total() * 5.0,
+            total_payout_low=low_score_counts.total() * 5.0,
             payout_by_team=payout_by_team,
         )
@@ -14,6 +14,13 @@ import pandas as pd
 from sleeper_analytics.models.player import PlayerValue
 
 
+@lru_cache(maxsize=1)
+def _import_nfl_data():
+    """Lazy import of nfl_data_py to avoid startup overhead."""
+    import nfl_data_py as nfl
+    return nfl
+
+
 class NFLStatsService:
     """
     Service for fetching and analyzing NFL player statistics using nfl_data_py.
@@ -30,18 +37,15 @@ class NFLStatsService:
         self._weekly_stats: pd.DataFrame | None = None
         self._seasonal_stats: pd.DataFrame | None = None
         self._rosters: pd.DataFrame | None = None
-
-    def _import_nfl_data(self):
-        """Lazy import of nfl_data_py to avoid startup overhead."""
-        import nfl_data_py as nfl
-        return nfl
+        self._name_postings: dict[str, np.ndarray] | None = None
+        self._rankings_cache: dict[tuple[str, int | None, str], pd.DataFrame] = {}
 
     @property
     def weekly_stats(self) -> pd.DataFrame:
         """Get weekly player stats (cached)."""
         if self._weekly_stats is None:
             try:
-                nfl = self._import_nfl_data()
+                nfl = _import_nfl_data()
                 self._weekly_stats = nfl.import_weekly_data([self.season])
             except Exception as e:
                 print(f"Error fetching weekly stats: {e}")
@@ -53,13 +57,28 @@ class NFLStatsService:
         """Get aggregated seasonal stats (cached)."""
         if self._seasonal_stats is None:
             try:
-                nfl = self._import_nfl_data()
+                nfl = _import_nfl_data()
                 self._seasonal_stats = nfl.import_seasonal_data([self.season])
             except Exception as e:
                 print(f"Error fetching seasonal stats: {e}")
                 self._seasonal_stats = pd.DataFrame()
         return self._seasonal_stats
 
+    @property
+    def _name_index(self) -> dict[str, np.ndarray]:
+        """Get weekly_stats row positions for each lowercased player name (cached)."""
+        if self._name_postings is None:
+            names = self.weekly_stats["player_display_name"].str.lower()
+            self._name_postings = names.groupby(names).indices
+        return self._name_postings
+
+    def _find_player_rows(self, df: pd.DataFrame, player_name: str) -> pd.DataFrame:
+        """Get a player's rows by exact name (any case), falling back to a contains match."""
+        positions = self._name_index.get(player_name.lower())
+        if positions is not None:
+            return df.iloc[positions]
+        return df[df["player_display_name"].str.contains(player_name, case=False, na=False)]
+
     def get_weekly_stats(self, weeks: list[int] | None = None) -> pd.DataFrame:
         """
         Get weekly player stats for the season.
@@ -74,8 +93,9 @@ class NFLStatsService:
         if df.empty:
             return df
 
+        # A boolean mask already returns a new frame; only the full table needs copying
         if weeks:
-            return df[df["week"].isin(weeks)].copy()
+            return df[df["week"].isin(weeks)]
         return df.copy()
 
     def get_player_weekly_points(
@@ -95,18 +115,7 @@ class NFLStatsService:
         if df.empty:
             return pd.DataFrame()
 
-        # Try exact match first
-        player_data = df[
-            df["player_display_name"].str.lower() == player_name.lower()
-        ].copy()
-
-        # Fall back to contains match
-        if player_data.empty:
-            player_data = df[
-                df["player_display_name"].str.contains(
-                    player_name, case=False, na=False
-                )
-            ].copy()
+        player_data = self._find_player_rows(df, player_name).copy()
 
         if player_data.empty:
             return pd.DataFrame()
@@ -152,12 +161,25 @@ class NFLStatsService:
             return pd.DataFrame()
 
         points_col = self._get_points_column(scoring)
-        pos_data = df[df["position"] == position.upper()].copy()
+        key = (position.upper(), week or None, points_col)
+        rankings = self._rankings_cache.get(key)
+        if rankings is None:
+            rankings = self._rankings_cache.setdefault(
+                key, self._rank_position(df, key[0], week, points_col)
+            )
+        return rankings.head(top_n).copy()
+
+    @staticmethod
+    def _rank_position(
+        df: pd.DataFrame, position: str, week: int | None, points_col: str
+    ) -> pd.DataFrame:
+        """Rank every player at a position, for one week or by season totals."""
+        pos_data = df[df["position"] == position]
 
         if week:
             pos_data = pos_data[pos_data["week"] == week]
             pos_data = pos_data.sort_values(points_col, ascending=False)
-            result = pos_data.head(top_n)[
+            result = pos_data[
                 ["player_display_name", "recent_team", points_col, "week"]
             ].copy()
             result["rank"] = range(1, len(result) + 1)
@@ -173,14 +195,13 @@ class NFLStatsService:
             season_totals["ppg"] = (
                 season_totals[points_col] / season_totals["games_played"]
             )
-            season_totals = season_totals.sort_values(points_col, ascending=False)
-            result = season_totals.head(top_n).copy()
+            result = season_totals.sort_values(points_col, ascending=False)
             result["rank"] = range(1, len(result) + 1)
             return result
 
     def calculate_player_value(
         self, player_name: str, position: str | None = None
-    ) -> PlayerValue | dict[str, Any]:
+    ) -> PlayerValue | None:
         """
         Calculate a player's trade value based on their production.
 
@@ -189,37 +210,30 @@ class NFLStatsService:
             position: Player's position (optional, will be detected)
 
         Returns:
-            PlayerValue model with value metrics
+            PlayerValue model with value metrics, or None if no stats are
+            available or the player is not found
         """
         df = self.weekly_stats
         if df.empty:
-            return {"error": "No stats available"}
+            return None
 
         # Find player data
-        player_data = df[
-            df["player_display_name"].str.lower() == player_name.lower()
-        ]
+        player_data = self._find_player_rows(df, player_name)
 
         if player_data.empty:
-            player_data = df[
-                df["player_display_name"].str.contains(
-                    player_name, case=False, na=False
-                )
-            ]
-
-        if player_data.empty:
-            return {"error": f"Player {player_name} not found"}
+            return None
 
         # Get position from data if not provided
         if position is None:
             position = player_data["position"].iloc[0]
 
         # Calculate metrics
-        points = player_data["fantasy_points_ppr"]
-        total_points = float(points.sum())
-        games = len(points)
+        # NaN-skipping reductions, matching the pandas Series sum/std they replace
+        points = player_data["fantasy_points_ppr"].to_numpy(dtype=np.float64)
+        total_points = float(np.nansum(points))
+        games = points.size
         ppg = total_points / games if games > 0 else 0
-        consistency = float(points.std()) if games > 1 else 0
+        consistency = float(np.nanstd(points, ddof=1)) if games > 1 else 0
 
         # Get position rank
         pos_rankings = self.get_position_rankings(position, top_n=100)
@@ -281,19 +295,16 @@ class NFLStatsService:
             return {"error": f"Player {player_name} not found"}
 
         position = player_data["position"].iloc[0]
-        total_points = float(player_data["fantasy_points_ppr"].sum())
+        # One reduction over every summed column; optional columns default to 0
+        summed_cols = ["fantasy_points_ppr"] + [
+            col for col in ("targets", "carries", "rushing_yards") if col in player_data.columns
+        ]
+        totals = player_data[summed_cols].sum()
+        total_points = float(totals["fantasy_points_ppr"])
 
         # Calculate opportunities
-        total_targets = (
-            int(player_data["targets"].sum())
-            if "targets" in player_data.columns
-            else 0
-        )
-        total_carries = (
-            int(player_data["carries"].sum())
-            if "carries" in player_data.columns
-            else 0
-        )
+        total_targets = int(totals.get("targets", 0))
+        total_carries = int(totals.get("carries", 0))
         total_opportunities = total_targets + total_carries
 
         efficiency: dict[str, Any] = {
@@ -318,7 +329,7 @@ class NFLStatsService:
         if position == "RB":
             efficiency["total_carries"] = total_carries
             if "rushing_yards" in player_data.columns and total_carries > 0:
-                rushing_yards = float(player_data["rushing_yards"].sum())
+                rushing_yards = float(totals["rushing_yards"])
                 efficiency["yards_per_carry"] = round(rushing_yards / total_carries, 2)
 
         return efficiency
@@ -350,43 +361,55 @@ class NFLStatsService:
             "rushing_tds",
         ]
 
-        comparison = []
-        for name, data in [(player1, p1_data), (player2, p2_data)]:
-            row: dict[str, Any] = {"player": name}
-            for col in stats_cols:
-                if col in data.columns:
-                    row[col] = float(data[col].sum())
-            row["games"] = len(data)
-            comparison.append(row)
+        present_cols = [col for col in stats_cols if col in df.columns]
+
+        p1_totals = p1_data[present_cols].sum()
+        p2_totals = p2_data[present_cols].sum()
+
+        comparison: dict[str, list[Any]] = {"player": [player1, player2]}
+        for col in present_cols:
+            comparison[col] = [float(p1_totals[col]), float(p2_totals[col])]
+        comparison["games"] = [len(p1_data), len(p2_data)]
 
         return pd.DataFrame(comparison)
 
 
+# Dynasty/keeper draft pick values, one row per round (1-4) of picks 1-12
+_PICK_VALUE_ROWS: tuple[tuple[float, ...], ...] = (
+    (100, 95, 90, 85, 80, 75, 70, 65, 60, 55, 50, 45),
+    (40, 38, 36, 34, 32, 30, 28, 26, 24, 22, 20, 18),
+    (15, 14, 13, 12, 11, 10, 9, 8, 7, 6, 5, 4),
+    (3, 3, 2, 2, 2, 2, 1, 1, 1, 1, 1, 1),
+)
+
+
 class TradeValueCalculator:
     """Calculates trade values for players and draft picks."""
 
     # Dynasty/keeper draft pick values (1-12 picks per round)
     PICK_VALUES: dict[int, dict[int, float]] = {
-        1: {1: 100, 2: 95, 3: 90, 4: 85, 5: 80, 6: 75, 7: 70, 8: 65, 9: 60, 10: 55, 11: 50, 12: 45},
-        2: {1: 40, 2: 38, 3: 36, 4: 34, 5: 32, 6: 30, 7: 28, 8: 26, 9: 24, 10: 22, 11: 20, 12: 18},
-        3: {1: 15, 2: 14, 3: 13, 4: 12, 5: 11, 6: 10, 7: 9, 8: 8, 9: 7, 10: 6, 11: 5, 12: 4},
-        4: {1: 3, 2: 3, 3: 2, 4: 2, 5: 2, 6: 2, 7: 1, 8: 1, 9: 1, 10: 1, 11: 1, 12: 1},
+        round_num: dict(enumerate(row, start=1))
+        for round_num, row in enumerate(_PICK_VALUE_ROWS, start=1)
     }
 
     def __init__(self, nfl_stats: NFLStatsService):
         self.nfl_stats = nfl_stats
+        self._value_cache: dict[tuple[str, str | None], float] = {}
 
     def get_player_trade_value(self, player_name: str, position: str | None = None) -> float:
-        """Get a player's trade value score."""
-        value_data = self.nfl_stats.calculate_player_value(player_name, position)
-
-        if isinstance(value_data, dict) and "error" in value_data:
-            return 0.0
-
-        if isinstance(value_data, PlayerValue):
-            return value_data.value_score
+        """Get a player's trade value score (cached per name and position)."""
+        key = (player_name.lower(), position)
+        value = self._value_cache.get(key)
+        if value is None:
+            value = self._value_cache.setdefault(
+                key, self._compute_player_trade_value(player_name, position)
+            )
+        return value
 
-        return 0.0
+    def _compute_player_trade_value(self, player_name: str, position: str | None) -> float:
+        """Compute a player's trade value score from their stats."""
+        value_data = self.nfl_stats.calculate_player_value(player_name, position)
+        return value_data.value_score if value_data is not None else 0.0
 
     def get_pick_value(self, round_num: int, pick_num: int = 6) -> float:
         """
@@ -399,9 +422,8 @@ class TradeValueCalculator:
         Returns:
             Trade value for the pick
         """
-        if round_num in self.PICK_VALUES:
-            pick_num = min(max(pick_num, 1), 12)
-            return self.PICK_VALUES[round_num].get(pick_num, 1.0)
+        if 1 <= round_num <= len(_PICK_VALUE_ROWS):
+            return _PICK_VALUE_ROWS[round_num - 1][min(max(pick_num, 1), 12) - 1]
         return 0.5
 
     def evaluate_trade(
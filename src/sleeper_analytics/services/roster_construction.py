@@ -8,6 +8,7 @@ import asyncio
 from collections import defaultdict
 
 from sleeper_analytics.clients.sleeper import LeagueContext, SleeperClient
+from sleeper_analytics.models import Transaction
 from sleeper_analytics.models.roster_construction import (
     AcquisitionMethod,
     LeagueRosterConstructionReport,
@@ -16,6 +17,14 @@ from sleeper_analytics.models.roster_construction import (
     TeamRosterConstruction,
 )
 
+# Methods in primary-source tie-break order
+_METHOD_ORDER = (
+    AcquisitionMethod.DRAFT,
+    AcquisitionMethod.TRADE,
+    AcquisitionMethod.WAIVER,
+    AcquisitionMethod.FREE_AGENT,
+)
+
 
 class RosterConstructionService:
     """
@@ -27,33 +36,81 @@ class RosterConstructionService:
     def __init__(self, client: SleeperClient, context: LeagueContext):
         self.client = client
         self.ctx = context
+        self._started_points_index: dict[int, dict[int, dict[str, dict[int, float]]]] = {}
+        self._roster_txn_index: dict[
+            int, dict[int, list[tuple[Transaction, list[str], list[str]]]]
+        ] = {}
 
-    async def _get_player_started_points_by_week(
-        self, player_id: str, roster_id: int, weeks: int = 17
-    ) -> dict[int, float]:
-        """Get points scored by a player each week ONLY when started by this team."""
-        matchups_by_week = await self.client.get_matchups_range(
-            self.ctx.league_id, 1, weeks
-        )
+    async def _build_started_points_index(
+        self, weeks: int = 17
+    ) -> dict[int, dict[str, dict[int, float]]]:
+        """
+        Index the points each team got from its starters every week, built once per season length.
 
-        points_by_week: dict[int, float] = {}
+        Returns:
+            Dict mapping roster ID to {player ID: {week: points}}, counting a player's
+            points only in weeks they were started by that roster
+        """
+        index = self._started_points_index.get(weeks)
+        if index is not None:
+            return index
 
+        matchups_by_week = await self.ctx.get_matchups_range(1, weeks)
+
+        built: dict[int, dict[str, dict[int, float]]] = defaultdict(lambda: defaultdict(dict))
         for week, matchups in matchups_by_week.items():
-            # Find this team's matchup for this week
-            team_matchup = next(
-                (m for m in matchups if m.get("roster_id") == roster_id), None
-            )
+            seen: set[int] = set()
+            for team_matchup in matchups:
+                roster_id = team_matchup.get("roster_id")
+                # Only a roster's first matchup entry in a week counts
+                if roster_id in seen:
+                    continue
+                seen.add(roster_id)
+
+                players_points = team_matchup.get("players_points") or {}
+                roster_points = built[roster_id]
+                for player_id in team_matchup.get("starters") or []:
+                    if player_id in players_points:
+                        roster_points[player_id][week] = float(players_points[player_id])
+
+        return self._started_points_index.setdefault(
+            weeks, {rid: dict(players) for rid, players in built.items()}
+        )
 
-            if team_matchup:
-                # Check if player was in starting lineup
-                starters = team_matchup.get("starters", [])
-                players_points = team_matchup.get("players_points", {})
+    async def _build_roster_txn_index(
+        self, weeks: int = 17
+    ) -> dict[int, list[tuple[Transaction, list[str], list[str]]]]:
+        """
+        Index transactions by the rosters they add players to or drop players from.
 
-                # Only count points if player was started
-                if player_id in starters and player_id in players_points:
-                    points_by_week[week] = float(players_points[player_id])
+        Only transactions with adds are indexed, matching the acquisition scan.
 
-        return points_by_week
+        Returns:
+            Dict mapping roster ID to (transaction, added player IDs, dropped player IDs)
+            tuples in transaction order
+        """
+        index = self._roster_txn_index.get(weeks)
+        if index is not None:
+            return index
+
+        all_transactions = await self.ctx.get_all_transactions(weeks)
+
+        built: dict[int, list[tuple[Transaction, list[str], list[str]]]] = defaultdict(list)
+        for txn in all_transactions:
+            if not txn.adds:
+                continue
+
+            added: dict[int, list[str]] = defaultdict(list)
+            for player_id, acquiring_roster in txn.adds.items():
+                added[acquiring_roster].append(player_id)
+            dropped: dict[int, list[str]] = defaultdict(list)
+            for player_id, dropping_roster in (txn.drops or {}).items():
+                dropped[dropping_roster].append(player_id)
+
+            for roster_id in added.keys() | dropped.keys():
+                built[roster_id].append((txn, added.get(roster_id, []), dropped.get(roster_id, [])))
+
+        return self._roster_txn_index.setdefault(weeks, dict(built))
 
     async def analyze_team_roster_construction(
         self, roster_id: int, weeks: int = 17
@@ -68,29 +125,50 @@ class RosterConstructionService:
         Returns:
             TeamRosterConstruction with acquisition breakdown
         """
-        # Get all transactions
-        all_transactions = await self.client.get_all_transactions(
-            self.ctx.league_id, weeks
+        roster_txn_index, started_points_index = await asyncio.gather(
+            self._build_roster_txn_index(weeks), self._build_started_points_index(weeks)
+        )
+        return self._compute_team_construction(
+            roster_id,
+            weeks,
+            roster_txn_index.get(roster_id, []),
+            started_points_index.get(roster_id, {}),
         )
 
+    def _compute_team_construction(
+        self,
+        roster_id: int,
+        weeks: int,
+        roster_txns: list[tuple[Transaction, list[str], list[str]]],
+        started_points: dict[str, dict[int, float]],
+    ) -> TeamRosterConstruction:
+        """
+        Build a team's roster construction from its indexed transactions and points.
+
+        Args:
+            roster_id: Team's roster ID
+            weeks: Number of weeks to analyze
+            roster_txns: Transactions that added players to or dropped players from this team
+            started_points: Points by week for each player, only when started by this team
+
+        Returns:
+            TeamRosterConstruction with acquisition breakdown
+        """
         # Track player acquisitions and ownership periods
         player_acquisitions: dict[str, dict] = {}
 
         # First, identify all players ever owned by this team
-        for txn in all_transactions:
-            if not txn.adds:
-                continue
-
-            for player_id, acquiring_roster in txn.adds.items():
-                if acquiring_roster == roster_id:
-                    # Determine acquisition method
-                    if txn.is_trade:
-                        method = AcquisitionMethod.TRADE
-                    elif txn.is_waiver:
-                        method = AcquisitionMethod.WAIVER
-                    else:
-                        method = AcquisitionMethod.FREE_AGENT
-
+        for txn, added, dropped in roster_txns:
+            if added:
+                # Determine acquisition method
+                if txn.is_trade:
+                    method = AcquisitionMethod.TRADE
+                elif txn.is_waiver:
+                    method = AcquisitionMethod.WAIVER
+                else:
+                    method = AcquisitionMethod.FREE_AGENT
+
+                for player_id in added:
                     player_acquisitions[player_id] = {
                         "method": method,
                         "week": txn.week,
@@ -99,10 +177,9 @@ class RosterConstructionService:
                     }
 
             # Check if player was dropped
-            if txn.drops:
-                for player_id, dropping_roster in txn.drops.items():
-                    if dropping_roster == roster_id and player_id in player_acquisitions:
-                        player_acquisitions[player_id]["end_week"] = txn.week - 1
+            for player_id in dropped:
+                if player_id in player_acquisitions:
+                    player_acquisitions[player_id]["end_week"] = txn.week - 1
 
         # Get current roster to identify drafted players
         current_roster = next(
@@ -124,15 +201,12 @@ class RosterConstructionService:
         acquisitions: list[PlayerAcquisition] = []
 
         for player_id, acq_info in player_acquisitions.items():
-            # Get player points by week (only when started by this team)
-            points_by_week = await self._get_player_started_points_by_week(
-                player_id, roster_id, weeks
-            )
+            points_by_week = started_points.get(player_id, {})
 
             # Sum points during ownership period (only weeks they were started)
+            start_week, end_week = acq_info["start_week"], acq_info["end_week"]
             total_points = sum(
-                points_by_week.get(w, 0)
-                for w in range(acq_info["start_week"], acq_info["end_week"] + 1)
+                pts for w, pts in points_by_week.items() if start_week <= w <= end_week
             )
 
             weeks_owned = acq_info["end_week"] - acq_info["start_week"] + 1
@@ -151,31 +225,27 @@ class RosterConstructionService:
                 )
             )
 
-        # Calculate breakdown by method
-        draft_points = sum(
-            a.points_scored for a in acquisitions
-            if a.acquisition_method == AcquisitionMethod.DRAFT
-        )
-        trade_points = sum(
-            a.points_scored for a in acquisitions
-            if a.acquisition_method == AcquisitionMethod.TRADE
-        )
-        waiver_points = sum(
-            a.points_scored for a in acquisitions
-            if a.acquisition_method == AcquisitionMethod.WAIVER
-        )
-        fa_points = sum(
-            a.points_scored for a in acquisitions
-            if a.acquisition_method == AcquisitionMethod.FREE_AGENT
-        )
+        # Group points and counts by method in one pass; each group is totalled with
+        # sum() so the method totals round exactly as a per-method sum() would
+        points_by_method: dict[AcquisitionMethod, list[float]] = defaultdict(list)
+        count_by_method: dict[AcquisitionMethod, int] = defaultdict(int)
+        for a in acquisitions:
+            points_by_method[a.acquisition_method].append(a.points_scored)
+            count_by_method[a.acquisition_method] += 1
+
+        method_points = {method: sum(points_by_method[method]) for method in _METHOD_ORDER}
+
+        draft_points = method_points[AcquisitionMethod.DRAFT]
+        trade_points = method_points[AcquisitionMethod.TRADE]
+        waiver_points = method_points[AcquisitionMethod.WAIVER]
+        fa_points = method_points[AcquisitionMethod.FREE_AGENT]
 
         total_points = draft_points + trade_points + waiver_points + fa_points
 
-        # Calculate counts
-        draft_count = len([a for a in acquisitions if a.acquisition_method == AcquisitionMethod.DRAFT])
-        trade_count = len([a for a in acquisitions if a.acquisition_method == AcquisitionMethod.TRADE])
-        waiver_count = len([a for a in acquisitions if a.acquisition_method == AcquisitionMethod.WAIVER])
-        fa_count = len([a for a in acquisitions if a.acquisition_method == AcquisitionMethod.FREE_AGENT])
+        draft_count = count_by_method[AcquisitionMethod.DRAFT]
+        trade_count = count_by_method[AcquisitionMethod.TRADE]
+        waiver_count = count_by_method[AcquisitionMethod.WAIVER]
+        fa_count = count_by_method[AcquisitionMethod.FREE_AGENT]
 
         breakdown = RosterConstructionBreakdown(
             draft_points=round(draft_points, 2),
@@ -193,14 +263,8 @@ class RosterConstructionService:
             free_agent_count=fa_count,
         )
 
-        # Determine primary source
-        method_points = {
-            AcquisitionMethod.DRAFT: draft_points,
-            AcquisitionMethod.TRADE: trade_points,
-            AcquisitionMethod.WAIVER: waiver_points,
-            AcquisitionMethod.FREE_AGENT: fa_points,
-        }
-        primary_source = max(method_points, key=method_points.get)
+        # Determine primary source (ties go to the earlier method)
+        primary_source = max(_METHOD_ORDER, key=method_points.__getitem__)
 
         # Draft reliance
         if breakdown.draft_percentage >= 70:
@@ -242,12 +306,20 @@ class RosterConstructionService:
         Returns:
             LeagueRosterConstructionReport with all teams
         """
-        # Analyze all teams concurrently
-        tasks = [
-            self.analyze_team_roster_construction(roster.roster_id, weeks)
+        # Build the shared indexes once, then every team's breakdown from them
+        roster_txn_index, started_points_index = await asyncio.gather(
+            self._build_roster_txn_index(weeks), self._build_started_points_index(weeks)
+        )
+
+        all_teams = [
+            self._compute_team_construction(
+                roster.roster_id,
+                weeks,
+                roster_txn_index.get(roster.roster_id, []),
+                started_points_index.get(roster.roster_id, {}),
+            )
             for roster in self.ctx.rosters
         ]
-        all_teams = await asyncio.gather(*tasks)
 
         # Calculate league averages
         avg_draft_pct = sum(t.breakdown.draft_percentage for t in all_teams) / len(all_teams)
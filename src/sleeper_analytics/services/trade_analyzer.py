@@ -4,6 +4,9 @@ Comprehensive Trade Analysis Service
 Analyzes trades from both value and roster needs perspectives.
 """
 
+import asyncio
+from collections import Counter
+
 from sleeper_analytics.clients.sleeper import LeagueContext, SleeperClient
 from sleeper_analytics.models.trade_analyzer import (
     ByeWeekImpact,
@@ -39,6 +42,18 @@ class TradeAnalyzerService:
         self.nfl_stats = nfl_stats
         self.trade_calc = TradeValueCalculator(nfl_stats)
         self.transaction_service = TransactionService(client, context, nfl_stats)
+        # Player (name, position) pairs, resolved once per player
+        self._player_info: dict[str, tuple[str, str]] = {}
+
+    def _describe_player(self, player_id: str) -> tuple[str, str]:
+        """Get a player's display name and position, resolving each player once."""
+        info = self._player_info.get(player_id)
+        if info is None:
+            info = self._player_info[player_id] = (
+                self.ctx.get_player_name(player_id),
+                self.ctx.get_player_position(player_id),
+            )
+        return info
 
     async def analyze_roster_needs(
         self, roster_id: int
@@ -53,19 +68,18 @@ class TradeAnalyzerService:
             Complete roster needs analysis
         """
         # Get roster
-        roster = next(r for r in self.ctx.rosters if r.roster_id == roster_id)
+        roster = self.ctx.get_roster(roster_id)
+        if roster is None:
+            raise ValueError(f"Roster {roster_id} not found")
         team_name = self.ctx.get_team_name(roster_id)
 
         # Analyze position depth
         position_needs = []
         positions = ["QB", "RB", "WR", "TE"]
+        position_counts = Counter(self._describe_player(p)[1] for p in roster.players)
 
         for pos in positions:
-            # Count players at this position
-            players = [
-                p for p in roster.players
-                if self.ctx.get_player_position(p) == pos
-            ]
+            player_count = position_counts[pos]
 
             # Determine starters needed (simplified)
             starters_needed = {
@@ -75,8 +89,8 @@ class TradeAnalyzerService:
                 "TE": 1,
             }.get(pos, 0)
 
-            current_starters = min(len(players), starters_needed)
-            bench_depth = max(0, len(players) - starters_needed)
+            current_starters = min(player_count, starters_needed)
+            bench_depth = max(0, player_count - starters_needed)
 
             # Determine need level
             if current_starters < starters_needed:
@@ -171,8 +185,10 @@ class TradeAnalyzerService:
             value_fairness = "Uneven"
 
         # Roster needs analysis
-        team_a_needs = await self.analyze_roster_needs(team_a_roster_id)
-        team_b_needs = await self.analyze_roster_needs(team_b_roster_id)
+        team_a_needs, team_b_needs = await asyncio.gather(
+            self.analyze_roster_needs(team_a_roster_id),
+            self.analyze_roster_needs(team_b_roster_id),
+        )
 
         # Analyze trade impact for Team A
         team_a_impact = self._analyze_trade_impact(
@@ -219,8 +235,7 @@ class TradeAnalyzerService:
 
     def _get_player_value(self, player_id: str) -> float:
         """Get estimated player value."""
-        player_name = self.ctx.get_player_name(player_id)
-        position = self.ctx.get_player_position(player_id)
+        _, position = self._describe_player(player_id)
 
         # Simplified value estimation
         # Could be enhanced with actual trade values or projections
@@ -242,24 +257,23 @@ class TradeAnalyzerService:
         """Analyze how a trade impacts roster needs."""
         position_improvements = {}
         position_downgrades = {}
+        needs_by_position = {n.position: n for n in needs.position_needs}
 
         # Analyze what they're giving away
         for player_id in gives_away:
-            pos = self.ctx.get_player_position(player_id)
-            player_name = self.ctx.get_player_name(player_id)
+            player_name, pos = self._describe_player(player_id)
 
             # Find position need
-            need = next((n for n in needs.position_needs if n.position == pos), None)
+            need = needs_by_position.get(pos)
             if need and need.need_level in ["critical", "moderate"]:
                 position_downgrades[pos] = f"Loses {player_name} at position of need"
 
         # Analyze what they're receiving
         for player_id in receives:
-            pos = self.ctx.get_player_position(player_id)
-            player_name = self.ctx.get_player_name(player_id)
+            player_name, pos = self._describe_player(player_id)
 
             # Find position need
-            need = next((n for n in needs.position_needs if n.position == pos), None)
+            need = needs_by_position.get(pos)
             if need and need.need_level == "critical":
                 position_improvements[pos] = f"Adds {player_name} to critical need"
             elif need and need.need_level == "moderate":
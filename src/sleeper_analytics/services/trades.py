@@ -5,8 +5,10 @@ Analyzes trades, waivers, and free agent moves with value calculations
 to determine trade fairness and identify transaction patterns.
 """
 
+import heapq
 from collections import defaultdict
-from typing import Any
+from operator import itemgetter
+from typing import Any, NamedTuple
 
 from sleeper_analytics.clients.sleeper import LeagueContext, SleeperClient
 from sleeper_analytics.models.transaction import (
@@ -20,6 +22,20 @@ from sleeper_analytics.models.transaction import (
 )
 from sleeper_analytics.services.nfl_stats import NFLStatsService, TradeValueCalculator
 
+# Sort key for waiver pickup rows
+_by_value = itemgetter("value")
+
+
+class _TransactionIndexes(NamedTuple):
+    """Transaction buckets and summary counts built in one pass over a season."""
+
+    by_type: dict[TransactionType, list[Transaction]]
+    by_roster: dict[int, list[Transaction]]
+    type_counts: dict[str, int]
+    week_counts: dict[int, int]
+    team_counts: dict[str, dict[str, int]]
+    total: int
+
 
 class TransactionService:
     """
@@ -42,10 +58,24 @@ class TransactionService:
         self.ctx = context
         self.nfl_stats = nfl_stats
         self.trade_calc = TradeValueCalculator(nfl_stats)
+        # Player (name, position) pairs, resolved once per player
+        self._player_info: dict[str, tuple[str, str]] = {}
+        self._value_cache: dict[tuple[str, str | None], float] = {}
+        self._indexes: dict[int, _TransactionIndexes] = {}
+
+    def _describe_player(self, player_id: str) -> tuple[str, str]:
+        """Get a player's display name and position, resolving each player once."""
+        info = self._player_info.get(player_id)
+        if info is None:
+            info = self._player_info[player_id] = (
+                self.ctx.get_player_name(player_id),
+                self.ctx.get_player_position(player_id),
+            )
+        return info
 
     async def get_all_transactions(self, weeks: int = 18) -> list[Transaction]:
         """
-        Get all transactions for the season.
+        Get all transactions for the season, fetched once per league context.
 
         Args:
             weeks: Number of weeks to fetch
@@ -53,7 +83,51 @@ class TransactionService:
         Returns:
             List of Transaction objects
         """
-        return await self.client.get_all_transactions(self.ctx.league_id, weeks)
+        return await self.ctx.get_all_transactions(weeks)
+
+    async def _get_indexes(self, weeks: int) -> _TransactionIndexes:
+        """Get the season's transaction indexes, building them once per weeks value."""
+        indexes = self._indexes.get(weeks)
+        if indexes is None:
+            all_txns = await self.get_all_transactions(weeks)
+            indexes = self._indexes.setdefault(weeks, self._build_indexes(all_txns))
+        return indexes
+
+    def _build_indexes(self, all_txns: list[Transaction]) -> _TransactionIndexes:
+        """
+        Bucket transactions by type and roster and tally summary counts in one pass.
+
+        Args:
+            all_txns: All transactions for the season
+
+        Returns:
+            _TransactionIndexes for the given transactions
+        """
+        by_type: dict[TransactionType, list[Transaction]] = defaultdict(list)
+        by_roster: dict[int, list[Transaction]] = defaultdict(list)
+        type_counts: dict[str, int] = defaultdict(int)
+        week_counts: dict[int, int] = defaultdict(int)
+        team_counts: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+        for txn in all_txns:
+            type_value = txn.type.value
+            by_type[txn.type].append(txn)
+            type_counts[type_value] += 1
+            week_counts[txn.week] += 1
+
+            for roster_id in txn.roster_ids:
+                team_counts[self.ctx.get_team_name(roster_id)][type_value] += 1
+            for roster_id in dict.fromkeys(txn.roster_ids):
+                by_roster[roster_id].append(txn)
+
+        return _TransactionIndexes(
+            by_type=dict(by_type),
+            by_roster=dict(by_roster),
+            type_counts=dict(type_counts),
+            week_counts=dict(week_counts),
+            team_counts={k: dict(v) for k, v in team_counts.items()},
+            total=len(all_txns),
+        )
 
     async def get_transactions_by_type(
         self, txn_type: TransactionType, weeks: int = 18
@@ -68,8 +142,8 @@ class TransactionService:
         Returns:
             List of filtered Transaction objects
         """
-        all_txns = await self.get_all_transactions(weeks)
-        return [t for t in all_txns if t.type == txn_type]
+        indexes = await self._get_indexes(weeks)
+        return list(indexes.by_type.get(txn_type, []))
 
     async def get_team_transactions(
         self, roster_id: int, weeks: int = 18
@@ -84,8 +158,8 @@ class TransactionService:
         Returns:
             List of Transaction objects involving this team
         """
-        all_txns = await self.get_all_transactions(weeks)
-        return [t for t in all_txns if roster_id in t.roster_ids]
+        indexes = await self._get_indexes(weeks)
+        return list(indexes.by_roster.get(roster_id, []))
 
     async def get_transaction_summary(self, weeks: int = 18) -> TransactionSummary:
         """
@@ -97,25 +171,13 @@ class TransactionService:
         Returns:
             TransactionSummary with aggregated stats
         """
-        all_txns = await self.get_all_transactions(weeks)
-
-        by_type: dict[str, int] = defaultdict(int)
-        by_week: dict[int, int] = defaultdict(int)
-        by_team: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
-
-        for txn in all_txns:
-            by_type[txn.type.value] += 1
-            by_week[txn.week] += 1
-
-            for roster_id in txn.roster_ids:
-                team_name = self.ctx.get_team_name(roster_id)
-                by_team[team_name][txn.type.value] += 1
+        indexes = await self._get_indexes(weeks)
 
         return TransactionSummary(
-            total=len(all_txns),
-            by_type=dict(by_type),
-            by_week=dict(by_week),
-            by_team={k: dict(v) for k, v in by_team.items()},
+            total=indexes.total,
+            by_type=dict(indexes.type_counts),
+            by_week=dict(indexes.week_counts),
+            by_team={k: dict(v) for k, v in indexes.team_counts.items()},
         )
 
     async def analyze_trades(self, weeks: int = 18) -> list[TradeAnalysis]:
@@ -155,16 +217,19 @@ class TransactionService:
 
         adds = trade.adds or {}
         draft_picks = trade.draft_picks
+        if not adds and not draft_picks:
+            return None
 
-        # Group assets by receiving roster
-        team_assets: dict[int, dict[str, list]] = defaultdict(
-            lambda: {"players": [], "picks": []}
-        )
+        # Group assets by receiving roster; assets for other rosters are never valued
+        team_assets: dict[int, dict[str, list]] = {
+            rid: {"players": [], "picks": []} for rid in trade.roster_ids
+        }
 
         # Players added to each roster
         for player_id, roster_id in adds.items():
-            player_name = self.ctx.get_player_name(player_id)
-            position = self.ctx.get_player_position(player_id)
+            if roster_id not in team_assets:
+                continue
+            player_name, position = self._describe_player(player_id)
             team_assets[roster_id]["players"].append({
                 "player_id": player_id,
                 "name": player_name,
@@ -173,6 +238,8 @@ class TransactionService:
 
         # Draft picks transferred
         for pick in draft_picks:
+            if pick.owner_id not in team_assets:
+                continue
             team_assets[pick.owner_id]["picks"].append({
                 "round": pick.round,
                 "season": pick.season,
@@ -262,7 +329,7 @@ class TransactionService:
         self, player_name: str, position: str | None = None
     ) -> float:
         """
-        Estimate a player's trade value using NFL stats.
+        Estimate a player's trade value using NFL stats (cached per name and position).
 
         Args:
             player_name: Player's display name
@@ -271,15 +338,19 @@ class TransactionService:
         Returns:
             Trade value score
         """
+        key = (player_name.lower(), position)
+        value = self._value_cache.get(key)
+        if value is not None:
+            return value
+
         value_data = self.nfl_stats.calculate_player_value(player_name, position)
 
-        if isinstance(value_data, dict):
-            if "error" in value_data:
-                return 20.0  # Default value for unknown players
-            return value_data.get("value_score", 20.0)
+        if value_data is None:
+            value = 20.0  # Default value for unknown players
+        else:
+            value = value_data.value_score
 
-        # It's a PlayerValue object
-        return value_data.value_score
+        return self._value_cache.setdefault(key, value)
 
     async def get_trade_winners_losers(
         self, weeks: int = 18
@@ -341,8 +412,7 @@ class TransactionService:
         for w in waivers:
             adds = w.adds or {}
             for player_id, roster_id in adds.items():
-                player_name = self.ctx.get_player_name(player_id)
-                position = self.ctx.get_player_position(player_id)
+                player_name, position = self._describe_player(player_id)
                 value = self._estimate_player_value(player_name, position)
 
                 pickups.append({
@@ -353,10 +423,7 @@ class TransactionService:
                     "value": round(value, 1),
                 })
 
-        # Sort by value
-        pickups.sort(key=lambda x: x["value"], reverse=True)
-
-        return pickups[:top_n]
+        return heapq.nlargest(top_n, pickups, key=_by_value)
 
     async def get_most_active_teams(self, weeks: int = 18) -> list[dict[str, Any]]:
         """
@@ -415,8 +482,7 @@ class TransactionService:
         team_a_assets = []
 
         for player_id in team_a_player_ids:
-            player_name = self.ctx.get_player_name(player_id)
-            position = self.ctx.get_player_position(player_id)
+            player_name, position = self._describe_player(player_id)
             value = self._estimate_player_value(player_name, position)
             team_a_value += value
             team_a_assets.append({
@@ -438,8 +504,7 @@ class TransactionService:
         team_b_assets = []
 
         for player_id in team_b_player_ids:
-            player_name = self.ctx.get_player_name(player_id)
-            position = self.ctx.get_player_position(player_id)
+            player_name, position = self._describe_player(player_id)
             value = self._estimate_player_value(player_name, position)
             team_b_value += value
             team_b_assets.append({
@@ -603,9 +668,7 @@ class TransactionService:
         )
 
         # Get all transactions
-        all_transactions = await self.client.get_all_transactions(
-            self.ctx.league_id, weeks
-        )
+        all_transactions = await self.get_all_transactions(weeks)
 
         # Filter for trades only
         trades = [txn for txn in all_transactions if txn.is_trade]
@@ -629,9 +692,7 @@ class TransactionService:
             )
 
         # Get matchups for point tracking
-        matchups_by_week = await self.client.get_matchups_range(
-            self.ctx.league_id, 1, weeks
-        )
+        matchups_by_week = await self.ctx.get_matchups_range(1, weeks)
 
         # Analyze each trade
         lopsided_trades: list[LopsidedTrade] = []
@@ -684,12 +745,13 @@ class TransactionService:
             for player_id in team_b_gave:
                 points, weeks_after = get_points_after_trade(player_id, trade_week)
                 ppw = points / weeks_after if weeks_after > 0 else 0
+                player_name, position = self._describe_player(player_id)
 
                 team_a_players.append(
                     TradePlayer(
                         player_id=player_id,
-                        player_name=self.ctx.get_player_name(player_id),
-                        position=self.ctx.get_player_position(player_id),
+                        player_name=player_name,
+                        position=position,
                         from_team=team_b_name,
                         to_team=team_a_name,
                         points_after_trade=round(points, 2),
@@ -706,12 +768,13 @@ class TransactionService:
             for player_id in team_a_gave:
                 points, weeks_after = get_points_after_trade(player_id, trade_week)
                 ppw = points / weeks_after if weeks_after > 0 else 0
+                player_name, position = self._describe_player(player_id)
 
                 team_b_players.append(
                     TradePlayer(
                         player_id=player_id,
-                        player_name=self.ctx.get_player_name(player_id),
-                        position=self.ctx.get_player_position(player_id),
+                        player_name=player_name,
+                        position=position,
                         from_team=team_a_name,
                         to_team=team_b_name,
                         points_after_trade=round(points, 2),